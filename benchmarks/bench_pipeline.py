@@ -0,0 +1,252 @@
+"""Benchmark the poll-to-state pipeline of the Inseego M3000 integration.
+
+Runs the coordinator against a local aiohttp stand-in serving the recorded
+payloads in ``benchmarks/fixtures`` and measures, per scenario:
+
+* ``_async_update_data`` end to end (HTTP, fingerprinting, decoding, parsing)
+* evaluating every ``value_fn`` / ``attributes_fn`` of the sensor and binary
+  sensor platforms against the resulting snapshot
+* memory allocated per poll (tracemalloc peak and retained bytes)
+
+Results are printed (or written with ``--output``) as JSON so runs of
+different versions can be compared. Requires Home Assistant to be installed.
+
+    python -m benchmarks.bench_pipeline --iterations 200 --output results.json
+
+The same scenarios run under pytest (see ``test_bench_pipeline.py``).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import timedelta
+import json
+from pathlib import Path
+import platform
+import re
+import socket
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from aiohttp import web
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.inseego_m3000.binary_sensor import BINARY_SENSOR_TYPES
+from custom_components.inseego_m3000.const import STATUS_PATH, USAGE_PATH
+from custom_components.inseego_m3000.coordinator import (
+    InseegoM3000DataUpdateCoordinator,
+)
+from custom_components.inseego_m3000.metrics import percentile
+from custom_components.inseego_m3000.sensor import RUNTIME_SENSOR_TYPES, SENSOR_TYPES
+
+FIXTURES = Path(__file__).parent / "fixtures"
+MANIFEST = (
+    Path(__file__).parent.parent / "custom_components" / "inseego_m3000" / "manifest.json"
+)
+
+# name: (status fixture, usage fixture, bump byte counters on every request)
+SCENARIOS: dict[str, tuple[str, str, bool]] = {
+    "typical_changing": ("status.json", "usage.json", True),
+    "typical_unchanged": ("status.json", "usage.json", False),
+    "oversized_changing": ("status_oversized.json", "usage.json", True),
+    "malformed_values": ("status_malformed.json", "usage_malformed.json", True),
+    "truncated_json": ("status_truncated.json", "usage.json", False),
+}
+
+
+# First numeric byte counter; the malformed fixture has a non-numeric one.
+_BYTE_COUNTER = re.compile(rb'("statusBarBytes(?:Received|Transmitted)": ")\d+"')
+
+
+class DeviceStandIn:
+    """Serve recorded /srv/status and /apps_home/usageinfo payloads."""
+
+    def __init__(self, status: bytes, usage: bytes, changing: bool) -> None:
+        """Initialize with raw fixture bodies."""
+        self._status = status
+        self._usage = usage
+        self._changing = changing
+        self._requests = 0
+        self._runner: web.AppRunner | None = None
+        self.host = ""
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        self._requests += 1
+        body = self._status
+        if self._changing:
+            # Make every response distinct, like a live device whose byte
+            # counters keep growing.
+            body = _BYTE_COUNTER.sub(
+                rb'\g<1>%d"' % (self._requests * 1500), body, 1
+            )
+        return web.Response(body=body, content_type="application/json")
+
+    async def _handle_usage(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._usage, content_type="application/json")
+
+    async def start(self) -> None:
+        """Start listening on a random local port."""
+        app = web.Application()
+        app.router.add_get(STATUS_PATH, self._handle_status)
+        app.router.add_get(USAGE_PATH, self._handle_usage)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        await web.SockSite(self._runner, sock).start()
+        self.host = "127.0.0.1:%d" % sock.getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def _summary(samples: list[float]) -> dict[str, float | None]:
+    """Summarize timing samples in microseconds."""
+    ordered = sorted(samples)
+    return {
+        "mean_us": round(statistics.fmean(ordered) * 1e6, 2) if ordered else None,
+        "p50_us": round(percentile(ordered, 0.5) * 1e6, 2) if ordered else None,
+        "p95_us": round(percentile(ordered, 0.95) * 1e6, 2) if ordered else None,
+        "max_us": round(ordered[-1] * 1e6, 2) if ordered else None,
+    }
+
+
+def _evaluate_entities(coordinator: InseegoM3000DataUpdateCoordinator) -> None:
+    """Evaluate every entity value/attribute function once."""
+    data = coordinator.data
+    for description in SENSOR_TYPES:
+        description.value_fn(data)
+        if description.attributes_fn:
+            description.attributes_fn(data)
+    for description in RUNTIME_SENSOR_TYPES:
+        description.value_fn(coordinator)
+        if description.attributes_fn:
+            description.attributes_fn(coordinator)
+    for description in BINARY_SENSOR_TYPES:
+        description.value_fn(data)
+
+
+async def run_scenario(
+    hass: HomeAssistant, name: str, iterations: int
+) -> dict[str, object]:
+    """Run one scenario and return its measurements."""
+    status_file, usage_file, changing = SCENARIOS[name]
+    device = DeviceStandIn(
+        (FIXTURES / status_file).read_bytes(),
+        (FIXTURES / usage_file).read_bytes(),
+        changing,
+    )
+    await device.start()
+    entry = SimpleNamespace(
+        entry_id=f"bench_{name}", data={CONF_HOST: device.host}, options={}
+    )
+    coordinator = InseegoM3000DataUpdateCoordinator(hass, entry)
+    # Fetch usage on every poll so both endpoints are always exercised.
+    coordinator.usage_interval = timedelta(0)
+
+    poll_times: list[float] = []
+    entity_times: list[float] = []
+    peak_bytes: list[int] = []
+    retained_bytes: list[int] = []
+    failures = 0
+    try:
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            started = time.perf_counter()
+            try:
+                data = await coordinator._async_update_data()  # noqa: SLF001
+            except UpdateFailed:
+                failures += 1
+                poll_times.append(time.perf_counter() - started)
+                continue
+            poll_times.append(time.perf_counter() - started)
+            coordinator.data = data
+            coordinator.last_update_success = True
+
+            started = time.perf_counter()
+            _evaluate_entities(coordinator)
+            entity_times.append(time.perf_counter() - started)
+
+            current, peak = tracemalloc.get_traced_memory()
+            peak_bytes.append(peak - before)
+            retained_bytes.append(current - before)
+    finally:
+        await coordinator.async_close()
+        await device.stop()
+
+    return {
+        "iterations": iterations,
+        "failures": failures,
+        "polls_processed": coordinator.polls_processed,
+        "polls_skipped": coordinator.polls_skipped,
+        "update_data": _summary(poll_times),
+        "entity_evaluation": _summary(entity_times),
+        "entities_evaluated": len(SENSOR_TYPES)
+        + len(RUNTIME_SENSOR_TYPES)
+        + len(BINARY_SENSOR_TYPES),
+        "alloc_peak_bytes_mean": round(statistics.fmean(peak_bytes))
+        if peak_bytes
+        else None,
+        "alloc_retained_bytes_mean": round(statistics.fmean(retained_bytes))
+        if retained_bytes
+        else None,
+    }
+
+
+async def run_scenarios(names: list[str], iterations: int) -> dict[str, object]:
+    """Run scenarios against a fresh Home Assistant instance."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        tracemalloc.start()
+        try:
+            return {name: await run_scenario(hass, name, iterations) for name in names}
+        finally:
+            tracemalloc.stop()
+            await hass.async_stop(force=True)
+
+
+def build_report(results: dict[str, object], iterations: int) -> dict[str, object]:
+    """Wrap scenario results with the versions they were measured with."""
+    return {
+        "integration_version": json.loads(MANIFEST.read_text())["version"],
+        "python": platform.python_version(),
+        "iterations": iterations,
+        "scenarios": results,
+    }
+
+
+async def main(args: argparse.Namespace) -> dict[str, object]:
+    """Run the selected scenarios."""
+    results = await run_scenarios(args.scenario or list(SCENARIOS), args.iterations)
+    return build_report(results, args.iterations)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(SCENARIOS), default=None
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results to a file")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+    text = json.dumps(report, indent=2)
+    if arguments.output:
+        arguments.output.write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
@@ -0,0 +1,55 @@
+"""pytest options and report collection for the benchmark suite."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_pipeline import build_report
+
+# A command line tool, not tests (it matches pytest's *_test.py pattern)
+collect_ignore = ["load_test.py"]
+
+_RESULTS = pytest.StashKey[dict[str, object]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark options."""
+    group = parser.getgroup("inseego_m3000 benchmarks")
+    group.addoption(
+        "--bench-iterations",
+        type=int,
+        default=50,
+        help="polls per benchmark scenario (default: 50)",
+    )
+    group.addoption(
+        "--bench-output", type=Path, help="write the JSON report to a file"
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_iterations(request: pytest.FixtureRequest) -> int:
+    """Return the number of polls per scenario."""
+    return request.config.getoption("--bench-iterations")
+
+
+@pytest.fixture(scope="session")
+def bench_results(request: pytest.FixtureRequest) -> dict[str, object]:
+    """Return the dict the scenario results are collected in."""
+    return request.config.stash.setdefault(_RESULTS, {})
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """Write the JSON report of the scenarios that ran."""
+    if not (results := config.stash.get(_RESULTS, None)):
+        return
+    report = build_report(results, config.getoption("--bench-iterations"))
+    text = json.dumps(report, indent=2)
+    if output := config.getoption("--bench-output"):
+        output.write_text(text + "\n")
+        terminalreporter.write_line(f"Benchmark report written to {output}")
+    else:
+        terminalreporter.write_line(text)
@@ -0,0 +1,244 @@
+"""Fleet-scale load test for the Inseego M3000 integration.
+
+Starts N simulated hotspots (``benchmarks.simulator``) in a separate process
+and N coordinators in a Home Assistant instance, sharing one fleet scheduler
+like N config entries would. Every coordinator gets one listener per sensor
+and binary sensor description, so refreshes fan out the same way they do with
+real entities. After ``--duration`` seconds the harness reports:
+
+* event loop lag (how late a periodic 50 ms timer fires)
+* poll latency percentiles and failures across all devices
+* entity updates dispatched
+* memory allocated per device (tracemalloc after the first refresh)
+
+    python -m benchmarks.load_test --devices 50 --duration 120 --scan-interval 5
+
+The simulator settings (``--latency``, ``--error-rate``, ...) are passed
+through to the simulated devices. Requires Home Assistant to be installed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.inseego_m3000.binary_sensor import BINARY_SENSOR_TYPES
+from custom_components.inseego_m3000.const import CONF_USAGE_SCAN_INTERVAL
+from custom_components.inseego_m3000.coordinator import (
+    InseegoM3000DataUpdateCoordinator,
+)
+from custom_components.inseego_m3000.fleet import InseegoM3000Fleet
+from custom_components.inseego_m3000.metrics import percentile
+from custom_components.inseego_m3000.sensor import SENSOR_TYPES
+
+from .simulator import add_arguments
+
+LAG_INTERVAL = 0.05  # seconds
+
+
+class LoopLagMonitor:
+    """Measure how late a periodic timer fires on the event loop."""
+
+    def __init__(self, interval: float = LAG_INTERVAL) -> None:
+        """Initialize the monitor."""
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self.samples: list[float] = []
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self._interval
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(time.perf_counter() - expected, 0))
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+def _summary_ms(samples: list[float]) -> dict[str, float | None]:
+    """Summarize timing samples in milliseconds."""
+    ordered = sorted(samples)
+    summary: dict[str, float | None] = {"count": len(ordered)}
+    for name, value in (
+        ("mean_ms", statistics.fmean(ordered) if ordered else None),
+        ("p50_ms", percentile(ordered, 0.5)),
+        ("p95_ms", percentile(ordered, 0.95)),
+        ("p99_ms", percentile(ordered, 0.99)),
+        ("max_ms", ordered[-1] if ordered else None),
+    ):
+        summary[name] = None if value is None else round(value * 1000, 3)
+    return summary
+
+
+async def _start_simulator(args: argparse.Namespace) -> tuple[
+    asyncio.subprocess.Process, list[str]
+]:
+    """Launch the simulator process and return it with the device hosts."""
+    command = [
+        sys.executable, "-m", "benchmarks.simulator",
+        "--devices", str(args.devices),
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--error-rate", str(args.error_rate),
+        "--timeout-rate", str(args.timeout_rate),
+        "--hang-time", str(args.hang_time),
+        "--flap-rate", str(args.flap_rate),
+    ]
+    if args.seed is not None:
+        command += ["--seed", str(args.seed)]
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        cwd=Path(__file__).parent.parent,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    assert process.stdout is not None
+    line = await process.stdout.readline()
+    if not line:
+        raise RuntimeError("Simulator exited before listening")
+    return process, json.loads(line)["hosts"]
+
+
+class _Counter:
+    """Count entity update callbacks."""
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    @callback
+    def __call__(self) -> None:
+        self.value += 1
+
+
+async def run(hass: HomeAssistant, args: argparse.Namespace) -> dict[str, object]:
+    """Run the load test and return its measurements."""
+    process, hosts = await _start_simulator(args)
+    fleet = InseegoM3000Fleet()
+    coordinators: list[InseegoM3000DataUpdateCoordinator] = []
+    poll_times: list[float] = []
+    poll_failures = 0
+    updates = _Counter()
+    unsubscribers = []
+    monitor = LoopLagMonitor()
+
+    def _timed(coordinator: InseegoM3000DataUpdateCoordinator):
+        """Wrap _async_update_data to record every poll's latency."""
+        update = coordinator._async_update_data  # noqa: SLF001
+
+        async def _async_update_data():
+            nonlocal poll_failures
+            started = time.perf_counter()
+            try:
+                return await update()
+            except Exception:
+                poll_failures += 1
+                raise
+            finally:
+                poll_times.append(time.perf_counter() - started)
+
+        return _async_update_data
+
+    try:
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        for index, host in enumerate(hosts):
+            entry = SimpleNamespace(
+                entry_id=f"load_test_{index}",
+                data={CONF_HOST: host},
+                options={
+                    CONF_SCAN_INTERVAL: args.scan_interval,
+                    CONF_USAGE_SCAN_INTERVAL: args.usage_scan_interval,
+                },
+            )
+            coordinator = InseegoM3000DataUpdateCoordinator(hass, entry)
+            coordinator._async_update_data = _timed(coordinator)  # noqa: SLF001
+            fleet.register(coordinator)
+            coordinators.append(coordinator)
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators)
+        )
+        for coordinator in coordinators:
+            for description in (*SENSOR_TYPES, *BINARY_SENSOR_TYPES):
+                unsubscribers.append(
+                    coordinator.async_add_listener(
+                        updates, frozenset(description.keys)
+                    )
+                )
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        monitor.start()
+        await asyncio.sleep(args.duration)
+        await monitor.stop()
+    finally:
+        for unsubscribe in unsubscribers:
+            unsubscribe()
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+            await coordinator.async_close()
+        process.terminate()
+        await process.wait()
+
+    return {
+        "devices": len(coordinators),
+        "duration_s": args.duration,
+        "scan_interval_s": args.scan_interval,
+        "event_loop_lag": _summary_ms(monitor.samples),
+        "poll_latency": _summary_ms(poll_times),
+        "poll_failures": poll_failures,
+        "polls_processed": sum(c.polls_processed for c in coordinators),
+        "polls_skipped": sum(c.polls_skipped for c in coordinators),
+        "entity_updates": updates.value,
+        "fleet": fleet.stats(),
+        "memory_per_device_bytes": round((after - before) / max(len(hosts), 1)),
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+async def main(args: argparse.Namespace) -> dict[str, object]:
+    """Run the load test inside a throwaway Home Assistant instance."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            return await run(hass, args)
+        finally:
+            await hass.async_stop(force=True)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--scan-interval", type=int, default=5)
+    parser.add_argument("--usage-scan-interval", type=int, default=60)
+    parser.add_argument("--output", type=Path, help="write JSON results to a file")
+    add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+    text = json.dumps(report, indent=2)
+    if arguments.output:
+        arguments.output.write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
@@ -0,0 +1,334 @@
+"""Simulated Inseego M3000 hotspots for testing without real hardware.
+
+Each simulated device listens on its own local port and serves
+``/srv/status`` and ``/apps_home/usageinfo`` in the same format as the real
+firmware (see ``benchmarks/fixtures``), plus a connected client list that
+matches the client counts. Values evolve between requests: the
+byte counters and billing usage grow, signal and SNR wander, clients come and
+go, the battery drains and charges and the connection occasionally flaps.
+
+Latency, jitter, HTTP errors and hanging requests can be injected to exercise
+the coordinator's failure handling. A UDP echo server stands in for the
+latency probe's targets; it applies the same latency and jitter and drops
+datagrams at the timeout rate.
+
+    python -m benchmarks.simulator --devices 3 --latency 0.05 --error-rate 0.02
+
+Once the devices are listening, a JSON line with their ``host:port`` values
+and the echo server's (``echo``) is printed to stdout; the devices can be
+added to Home Assistant like real hotspots and the echo server used as a
+latency probe target.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import random
+import socket
+import sys
+import time
+
+from aiohttp import web
+
+STATUS_PATH = "/srv/status"
+USAGE_PATH = "/apps_home/usageinfo"
+CLIENTS_PATH = "/apps_home/connecteddevicesinfo"
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+GIGABYTE = 1024**3
+
+
+@dataclass
+class SimulatorSettings:
+    """Fault injection and behaviour settings shared by simulated devices."""
+
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # seconds, uniform 0..jitter added on top of latency
+    error_rate: float = 0.0  # probability of an HTTP 500 response
+    timeout_rate: float = 0.0  # probability of a request that never answers
+    hang_time: float = 60.0  # seconds a "timed out" request is held open
+    flap_rate: float = 0.01  # probability per status request of a state flip
+
+
+class SimulatedM3000:
+    """One simulated hotspot with evolving radio, traffic and billing state."""
+
+    def __init__(self, settings: SimulatorSettings, seed: int | None = None) -> None:
+        """Initialize the device state."""
+        self.settings = settings
+        self._random = random.Random(seed)
+        self._status_template = json.loads((FIXTURES / "status.json").read_text())
+        self._usage_template = json.loads((FIXTURES / "usage.json").read_text())
+        self._updated_at = time.monotonic()
+        self._runner: web.AppRunner | None = None
+        self.host = ""
+        self.requests = 0
+
+        rnd = self._random
+        self.connected = True
+        self.connection_duration = rnd.uniform(0, 86400)
+        self.bytes_received = rnd.uniform(0, 50 * GIGABYTE)
+        self.bytes_transmitted = self.bytes_received * rnd.uniform(0.05, 0.2)
+        self.rx_rate = rnd.uniform(0, 2_000_000)  # bytes/s
+        self.tx_rate = rnd.uniform(0, 300_000)
+        self.snr = rnd.uniform(0, 25)
+        self.battery = rnd.uniform(20, 100)
+        self.charging = rnd.random() < 0.5
+        self.wifi_clients = rnd.randint(0, 6)
+        self._mac_prefix = ":".join(f"{rnd.randrange(256):02x}" for _ in range(4))
+        self.allowance = 100.0  # GB
+        self.line_usage = rnd.uniform(0, 60)  # GB
+        self.days_left = rnd.randint(1, 30)
+
+    def _advance(self) -> None:
+        """Evolve the device state up to the current time."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        rnd = self._random
+
+        if rnd.random() < self.settings.flap_rate:
+            self.connected = not self.connected
+            self.connection_duration = 0
+        if not self.connected:
+            return
+
+        self.connection_duration += elapsed
+        # Random walks, clamped to plausible ranges.
+        self.rx_rate = min(max(self.rx_rate * rnd.uniform(0.7, 1.3), 1_000), 50_000_000)
+        self.tx_rate = min(max(self.tx_rate * rnd.uniform(0.7, 1.3), 500), 10_000_000)
+        self.snr = min(max(self.snr + rnd.uniform(-1.5, 1.5), -10), 30)
+        received = self.rx_rate * elapsed
+        transmitted = self.tx_rate * elapsed
+        self.bytes_received += received
+        self.bytes_transmitted += transmitted
+        self.line_usage += (received + transmitted) / GIGABYTE
+
+        if self.charging:
+            self.battery = min(self.battery + elapsed * 0.01, 100)
+            self.charging = self.battery < 100
+        else:
+            self.battery = max(self.battery - elapsed * 0.005, 0)
+            self.charging = self.battery < 15
+        if rnd.random() < 0.05:
+            self.wifi_clients = max(self.wifi_clients + rnd.choice((-1, 1)), 0)
+
+    @property
+    def signal_bars(self) -> int:
+        """Map the SNR onto the 0-5 signal bar scale."""
+        if not self.connected:
+            return 0
+        return min(max(int((self.snr + 5) // 7), 0), 5)
+
+    def status_payload(self) -> dict:
+        """Build a /srv/status response body."""
+        self._advance()
+        data = dict(self._status_template["statusData"])
+        total = int(self.bytes_received + self.bytes_transmitted)
+        clients = self.wifi_clients + 1
+        data.update(
+            {
+                "statusBarConnectionState": (
+                    "Connected" if self.connected else "Disconnected"
+                ),
+                "statusBarConnectionDuration": str(int(self.connection_duration)),
+                "statusBarBytesReceived": str(int(self.bytes_received)),
+                "statusBarBytesTransmitted": str(int(self.bytes_transmitted)),
+                "statusBarBytesTotal": str(total),
+                "statusBarSNR": str(round(self.snr)),
+                "statusBarSignalBars": str(self.signal_bars),
+                "statusBarBatteryPercent": str(round(self.battery)),
+                "statusBarBatteryChargingState": "true" if self.charging else "false",
+                "statusBarClientListSize": str(clients),
+                "statusBarWiFiClientListSize": str(self.wifi_clients),
+                "statusBarPrimaryClientListSize": str(clients),
+            }
+        )
+        return {"statusData": data}
+
+    def clients_payload(self) -> dict:
+        """Build a connected client list: the Wi-Fi clients and one USB client."""
+        self._advance()
+        # (connection type, MAC suffix, last IP octet)
+        clients = [("WiFi", index, 100 + index) for index in range(self.wifi_clients)]
+        clients.append(("USB", 255, 2))
+        return {
+            "connectedDevices": [
+                {
+                    "hostName": f"client-{index}",
+                    "macAddress": f"02:{self._mac_prefix}:{index:02x}".upper(),
+                    "ipAddress": f"192.168.1.{octet}",
+                    "connectionType": connection_type,
+                }
+                for connection_type, index, octet in clients
+            ]
+        }
+
+    def usage_payload(self) -> dict:
+        """Build a /apps_home/usageinfo response body."""
+        self._advance()
+        remaining = max(self.allowance - self.line_usage, 0)
+        data = dict(self._usage_template)
+        data.update(
+            {
+                "lineUsage": f"{self.line_usage:.2f}",
+                "allowance": f"{self.allowance:.0f}",
+                "remainingUsage": f"{remaining:.2f}",
+                "barPercentageRemaining": str(int(remaining * 100 / self.allowance)),
+                "daysLeft": str(self.days_left),
+                "rxUsage": f"{self.line_usage * 0.9:.2f}",
+                "txUsage": f"{self.line_usage * 0.1:.2f}",
+            }
+        )
+        return data
+
+    async def _respond(self, payload: dict) -> web.Response:
+        """Apply the configured faults and serve a payload."""
+        self.requests += 1
+        settings = self.settings
+        delay = settings.latency + self._random.uniform(0, settings.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self._random.random() < settings.timeout_rate:
+            await asyncio.sleep(settings.hang_time)
+        if self._random.random() < settings.error_rate:
+            return web.Response(status=500, text="Internal Server Error")
+        return web.json_response(payload)
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        return await self._respond(self.status_payload())
+
+    async def _handle_usage(self, request: web.Request) -> web.Response:
+        return await self._respond(self.usage_payload())
+
+    async def _handle_clients(self, request: web.Request) -> web.Response:
+        return await self._respond(self.clients_payload())
+
+    async def start(self, address: str = "127.0.0.1") -> None:
+        """Start listening on a random port."""
+        app = web.Application()
+        app.router.add_get(STATUS_PATH, self._handle_status)
+        app.router.add_get(USAGE_PATH, self._handle_usage)
+        app.router.add_get(CLIENTS_PATH, self._handle_clients)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind((address, 0))
+        await web.SockSite(self._runner, sock, shutdown_timeout=0.1).start()
+        self.host = "%s:%d" % sock.getsockname()
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+class SimulatedEcho(asyncio.DatagramProtocol):
+    """UDP echo server with injectable delay and loss."""
+
+    def __init__(self, settings: SimulatorSettings, seed: int | None = None) -> None:
+        """Initialize the echo server."""
+        self.settings = settings
+        self._random = random.Random(seed)
+        self._transport: asyncio.DatagramTransport | None = None
+        self.host = ""
+        self.datagrams = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self.datagrams += 1
+        settings = self.settings
+        if self._random.random() < settings.timeout_rate:
+            return
+        delay = settings.latency + self._random.uniform(0, settings.jitter)
+        asyncio.get_running_loop().call_later(delay, self._echo, data, addr)
+
+    def _echo(self, data: bytes, addr: tuple[str, int]) -> None:
+        if self._transport is not None:
+            self._transport.sendto(data, addr)
+
+    async def start(self, address: str = "127.0.0.1") -> None:
+        """Start listening on a random port."""
+        await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: self, local_addr=(address, 0)
+        )
+        assert self._transport is not None
+        self.host = "%s:%d" % self._transport.get_extra_info("sockname")[:2]
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._transport is not None:
+            self._transport.close()
+
+
+async def start_devices(
+    count: int,
+    settings: SimulatorSettings,
+    seed: int | None = None,
+    address: str = "127.0.0.1",
+) -> list[SimulatedM3000]:
+    """Start ``count`` simulated devices."""
+    devices = [
+        SimulatedM3000(settings, None if seed is None else seed + index)
+        for index in range(count)
+    ]
+    await asyncio.gather(*(device.start(address) for device in devices))
+    return devices
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the simulator settings to an argument parser."""
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--hang-time", type=float, default=60.0)
+    parser.add_argument("--flap-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def settings_from_args(args: argparse.Namespace) -> SimulatorSettings:
+    """Build simulator settings from parsed arguments."""
+    return SimulatorSettings(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        hang_time=args.hang_time,
+        flap_rate=args.flap_rate,
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run simulated devices until interrupted."""
+    settings = settings_from_args(args)
+    devices = await start_devices(args.devices, settings, args.seed, args.address)
+    echo = SimulatedEcho(settings, args.seed)
+    await echo.start(args.address)
+    sys.stdout.write(
+        json.dumps({"hosts": [device.host for device in devices], "echo": echo.host})
+        + "\n"
+    )
+    sys.stdout.flush()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await echo.stop()
+        await asyncio.gather(*(device.stop() for device in devices))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--address", default="127.0.0.1")
+    add_arguments(parser)
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
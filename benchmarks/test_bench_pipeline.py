@@ -0,0 +1,39 @@
+"""Run the pipeline benchmark scenarios under pytest.
+
+    python -m pytest benchmarks --bench-iterations 200 --bench-output results.json
+
+Each scenario is a test, so a scenario that stops polling as expected fails
+the run. The JSON report is the one ``bench_pipeline.py`` prints.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from benchmarks.bench_pipeline import SCENARIOS, run_scenarios
+
+# Scenarios whose status payload cannot be parsed: every poll must fail.
+FAILING_SCENARIOS = {"truncated_json"}
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_pipeline(
+    scenario: str, bench_iterations: int, bench_results: dict[str, object]
+) -> None:
+    """Benchmark one scenario and check that it polled as expected."""
+    result = asyncio.run(run_scenarios([scenario], bench_iterations))[scenario]
+    bench_results[scenario] = result
+
+    if scenario in FAILING_SCENARIOS:
+        assert result["failures"] == bench_iterations
+        return
+    assert result["failures"] == 0
+    assert result["polls_processed"] + result["polls_skipped"] == bench_iterations
+    _, _, changing = SCENARIOS[scenario]
+    if changing:
+        assert result["polls_skipped"] == 0
+    else:
+        # Only the first response is decoded; the second poll publishes the
+        # first rates (zero, as the counters did not move).
+        assert result["polls_processed"] == 2
@@ -0,0 +1,109 @@
+"""Run the latency prober against the simulator's UDP echo server.
+
+    python -m pytest benchmarks/test_latency_probe.py
+
+The echo server stands in for the DNS targets, with injected delay, jitter
+and loss, so the reported latency, jitter and loss can be checked.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from benchmarks.simulator import SimulatedEcho, SimulatorSettings
+from custom_components.inseego_m3000 import probe
+from custom_components.inseego_m3000.const import LATENCY_SAMPLES
+from custom_components.inseego_m3000.probe import LatencyProber, parse_targets
+
+ROUNDS = 30
+
+
+async def probe_echo(settings: SimulatorSettings, targets: int) -> dict:
+    """Probe ``targets`` echo servers ROUNDS times; return the last summary."""
+    echoes = [SimulatedEcho(settings, seed) for seed in range(targets)]
+    for echo in echoes:
+        await echo.start()
+    # Without a hotspot to route through, the prober doesn't use hass.
+    prober = LatencyProber(
+        None,
+        "test",
+        parse_targets(", ".join(echo.host for echo in echoes)),
+        60,
+        lambda: None,
+    )
+    try:
+        for _ in range(ROUNDS):
+            await prober._async_probe()
+    finally:
+        for echo in echoes:
+            await echo.stop()
+    assert all(echo.datagrams == ROUNDS for echo in echoes)
+    return prober.summary
+
+
+@pytest.fixture(autouse=True)
+def short_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Count a query as lost after 100 ms rather than seconds."""
+    monkeypatch.setattr(probe, "LATENCY_TIMEOUT", 0.1)
+
+
+def test_latency_and_jitter() -> None:
+    """Delay and jitter of the replies are reported, without loss."""
+    settings = SimulatorSettings(latency=0.02, jitter=0.02)
+    summary = asyncio.run(probe_echo(settings, 1))
+    assert summary["samples"] == ROUNDS
+    assert summary["loss"] == 0
+    # Uniform jitter: the median is around 30 ms, and consecutive replies
+    # differ by about a third of the 20 ms range on average.
+    assert 20 <= summary["latency"] <= 60
+    assert summary["latency"] <= summary["p95"] <= 100
+    assert 2 <= summary["jitter"] <= 15
+
+
+def test_loss() -> None:
+    """Queries without a reply count as lost, over the last samples only."""
+    settings = SimulatorSettings(latency=0.005, timeout_rate=0.3)
+    summary = asyncio.run(probe_echo(settings, 3))
+    assert summary["samples"] == LATENCY_SAMPLES
+    assert 10 <= summary["loss"] <= 50
+    assert summary["latency"] is not None
+
+
+def test_everything_lost() -> None:
+    """Without any reply there is no latency or jitter."""
+    settings = SimulatorSettings(timeout_rate=1)
+    summary = asyncio.run(probe_echo(settings, 1))
+    assert summary == {
+        "latency": None,
+        "p95": None,
+        "jitter": None,
+        "loss": 100.0,
+        "samples": ROUNDS,
+    }
+
+
+@pytest.mark.parametrize(
+    ("text", "targets"),
+    [
+        ("1.1.1.1", [("1.1.1.1", 53)]),
+        ("1.1.1.1:5353, 8.8.8.8", [("1.1.1.1", 5353), ("8.8.8.8", 53)]),
+        (
+            "[2606:4700::1111]:853 dns.test",
+            [("2606:4700::1111", 853), ("dns.test", 53)],
+        ),
+        ("[2606:4700::1111]", [("2606:4700::1111", 53)]),
+    ],
+)
+def test_parse_targets(text: str, targets: list[tuple[str, int]]) -> None:
+    """Hosts, host:port and bracketed IPv6 addresses, default port 53."""
+    assert parse_targets(text) == targets
+
+
+@pytest.mark.parametrize(
+    "text", ["", " , ", "host:", "host:0", "host:65536", "[::1", "[::1]53", ":53"]
+)
+def test_parse_targets_invalid(text: str) -> None:
+    """Empty lists and malformed entries are rejected."""
+    with pytest.raises(ValueError):
+        parse_targets(text)
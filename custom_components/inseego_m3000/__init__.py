@@ -4,14 +4,19 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import DOMAIN
-from .coordinator import InseegoM3000DataUpdateCoordinator
+from .const import DATA_FLEET, DOMAIN
+from .coordinator import InseegoM3000DataUpdateCoordinator, snapshot_store
+from .fleet import InseegoM3000Fleet
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
+PLATFORMS: list[Platform] = [
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.DEVICE_TRACKER,
+]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,23 +24,73 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Inseego M3000 from a config entry."""
     coordinator = InseegoM3000DataUpdateCoordinator(hass, entry)
-    
-    await coordinator.async_config_entry_first_refresh()
-    
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady("Failed to connect to Inseego M3000")
+
+    # All hotspots share one fleet so their polls are staggered and the
+    # number of in-flight device requests stays bounded.
+    if DATA_FLEET not in hass.data:
+        hass.data[DATA_FLEET] = InseegoM3000Fleet()
+    fleet: InseegoM3000Fleet = hass.data[DATA_FLEET]
+    fleet.register(coordinator)
+
+    if await coordinator.async_restore():
+        # Entities start from the last known (stale) snapshot right away;
+        # the first live poll must not hold up Home Assistant's startup.
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} first refresh {coordinator.host}",
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            fleet.unregister(coordinator)
+            await coordinator.async_close()
+            raise
+
+        if not coordinator.last_update_success:
+            fleet.unregister(coordinator)
+            await coordinator.async_close()
+            raise ConfigEntryNotReady("Failed to connect to Inseego M3000")
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    async def _async_close_session(event: Event) -> None:
+        """Close the device session when Home Assistant stops."""
+        await coordinator.async_close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated polling intervals without reloading the entry."""
+    coordinator: InseegoM3000DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_apply_options(entry)
+    await coordinator.async_request_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        fleet: InseegoM3000Fleet = hass.data[DATA_FLEET]
+        fleet.unregister(coordinator)
+        if not fleet.coordinators:
+            hass.data.pop(DATA_FLEET)
+        await coordinator.async_close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored snapshot of a removed config entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
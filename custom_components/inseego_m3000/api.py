@@ -0,0 +1,73 @@
+"""HTTP session handling for Inseego M3000 hotspots."""
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import aiohttp
+
+from .const import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    DEVICE_CONNECTION_LIMIT,
+)
+
+
+async def _on_connection_create_start(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateStartParams,
+) -> None:
+    context.connect_started = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    params: aiohttp.TraceConnectionCreateEndParams,
+) -> None:
+    # trace_request_ctx is the dict the caller passed to session.get()
+    if isinstance(context.trace_request_ctx, dict):
+        context.trace_request_ctx["connect"] = (
+            time.perf_counter() - context.connect_started
+        )
+
+
+def _create_timing_trace() -> aiohttp.TraceConfig:
+    """Create a trace that reports new connection setup times.
+
+    Requests made with ``trace_request_ctx={}`` get a ``connect`` entry
+    when a new connection had to be opened for them.
+    """
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_start.append(_on_connection_create_start)
+    trace.on_connection_create_end.append(_on_connection_create_end)
+    return trace
+
+
+def create_device_session() -> aiohttp.ClientSession:
+    """Create a client session tuned for polling a single LAN device.
+
+    Connections are kept alive between polls and the device host is resolved
+    once, so a regular poll skips both DNS and the TCP handshake. Connect and
+    read timeouts are separate so an unreachable device fails fast. New
+    connection setup times are traced for the coordinator's timings.
+
+    The caller owns the session and must close it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=DEVICE_CONNECTION_LIMIT,
+        keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=None,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(
+            total=None,
+            connect=DEFAULT_CONNECT_TIMEOUT,
+            sock_read=DEFAULT_TIMEOUT,
+        ),
+        trace_configs=[_create_timing_trace()],
+    )
@@ -10,75 +10,26 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import InseegoM3000DataUpdateCoordinator
+from .filters import Debouncer
+from .models import InseegoM3000Data
 
 
 @dataclass
 class InseegoBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes Inseego binary sensor entity."""
 
-    value_fn: Callable[[dict], bool] = None
-
-
-def is_connected(data: dict) -> bool:
-    """Check if device is connected."""
-    status_data = data.get("statusData", {})
-    state = status_data.get("statusBarConnectionState", "")
-    return state == "Connected"
-
-
-def is_wifi_enabled(data: dict) -> bool:
-    """Check if WiFi is enabled."""
-    status_data = data.get("statusData", {})
-    enabled = status_data.get("statusBarWiFiEnabled", 0)
-    return bool(enabled)
-
-
-def is_mobile_data_enabled(data: dict) -> bool:
-    """Check if mobile data is enabled."""
-    status_data = data.get("statusData", {})
-    enabled = status_data.get("statusBarMobileDataEnabled", 0)
-    return bool(enabled)
-
-
-def is_charging(data: dict) -> bool:
-    """Check if battery is charging."""
-    status_data = data.get("statusData", {})
-    charging = status_data.get("statusBarBatteryChargingState", "false")
-    return charging.lower() == "true"
-
-
-def is_battery_present(data: dict) -> bool:
-    """Check if battery is present."""
-    status_data = data.get("statusData", {})
-    detection = status_data.get("statusBarBatteryDetection", "")
-    return detection == "Present"
-
-
-def is_ethernet_connected(data: dict) -> bool:
-    """Check if ethernet is connected."""
-    status_data = data.get("statusData", {})
-    port_enabled = status_data.get("statusBarEthernetPortEnabled", "")
-    return port_enabled == "connected"
-
-
-def is_airplane_mode(data: dict) -> bool:
-    """Check if airplane mode is on."""
-    status_data = data.get("statusData", {})
-    mode = status_data.get("statusBarAirplaneMode", "")
-    return mode != "AirplaneModeOff"
-
-
-def is_guest_wifi_enabled(data: dict) -> bool:
-    """Check if guest WiFi is enabled."""
-    status_data = data.get("statusData", {})
-    enabled = status_data.get("statusBarGuestWifiEnabled", 0)
-    return bool(enabled)
+    value_fn: Callable[[InseegoM3000Data], bool] = None
+    # Snapshot fields read by value_fn; see InseegoSensorEntityDescription.
+    keys: tuple[str, ...] = ()
+    # With the noise filter enabled, a transition is only published once it
+    # lasted the configured number of polls.
+    debounce: bool = False
 
 
 BINARY_SENSOR_TYPES: tuple[InseegoBinarySensorEntityDescription, ...] = (
@@ -86,54 +37,63 @@ BINARY_SENSOR_TYPES: tuple[InseegoBinarySensorEntityDescription, ...] = (
         key="connection",
         name="Connection",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=is_connected,
+        keys=("connection_state",),
+        debounce=True,
+        value_fn=lambda data: data.status.connection_state == "Connected",
     ),
     InseegoBinarySensorEntityDescription(
         key="wifi",
         name="WiFi Connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon="mdi:wifi",
-        value_fn=is_wifi_enabled,
+        keys=("wifi_enabled",),
+        value_fn=lambda data: data.status.wifi_enabled,
     ),
     InseegoBinarySensorEntityDescription(
         key="mobile_data",
         name="Mobile Data Enabled",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon="mdi:signal",
-        value_fn=is_mobile_data_enabled,
+        keys=("mobile_data_enabled",),
+        value_fn=lambda data: data.status.mobile_data_enabled,
     ),
     InseegoBinarySensorEntityDescription(
         key="battery_charging",
         name="Battery Charging",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-        value_fn=is_charging,
+        keys=("battery_charging",),
+        value_fn=lambda data: data.status.battery_charging,
     ),
     InseegoBinarySensorEntityDescription(
         key="battery_present",
         name="Battery Present",
         device_class=BinarySensorDeviceClass.PLUG,
         icon="mdi:battery",
-        value_fn=is_battery_present,
+        keys=("battery_present",),
+        value_fn=lambda data: data.status.battery_present,
     ),
     InseegoBinarySensorEntityDescription(
         key="ethernet",
         name="Ethernet Connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon="mdi:ethernet",
-        value_fn=is_ethernet_connected,
+        keys=("ethernet_connected",),
+        value_fn=lambda data: data.status.ethernet_connected,
     ),
     InseegoBinarySensorEntityDescription(
         key="airplane_mode",
         name="Airplane Mode",
         icon="mdi:airplane",
-        value_fn=is_airplane_mode,
+        keys=("airplane_mode",),
+        value_fn=lambda data: data.status.airplane_mode,
     ),
     InseegoBinarySensorEntityDescription(
         key="guest_wifi",
         name="Guest WiFi Enabled",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon="mdi:wifi-star",
-        value_fn=is_guest_wifi_enabled,
+        keys=("guest_wifi_enabled",),
+        value_fn=lambda data: data.status.guest_wifi_enabled,
     ),
 )
 
@@ -146,12 +106,14 @@ async def async_setup_entry(
     """Set up Inseego M3000 binary sensor based on a config entry."""
     coordinator: InseegoM3000DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
-        InseegoM3000BinarySensor(coordinator, description)
-        for description in BINARY_SENSOR_TYPES
-    ]
-
-    async_add_entities(entities)
+    # Binary sensors are created once their field is reported by the device.
+    entry.async_on_unload(
+        coordinator.async_add_reported_entities(
+            BINARY_SENSOR_TYPES,
+            lambda description: InseegoM3000BinarySensor(coordinator, description),
+            async_add_entities,
+        )
+    )
 
 
 class InseegoM3000BinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -159,6 +121,7 @@ class InseegoM3000BinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     entity_description: InseegoBinarySensorEntityDescription
     _attr_has_entity_name = True
+    _unrecorded_attributes = frozenset({"stale"})
 
     def __init__(
         self,
@@ -166,22 +129,48 @@ class InseegoM3000BinarySensor(CoordinatorEntity, BinarySensorEntity):
         description: InseegoBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset(description.keys) or None)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.host}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.host)},
-            "name": f"Inseego M3000 ({coordinator.host})",
-            "manufacturer": "Inseego",
-            "model": "M3000",
-            "sw_version": coordinator.data.get("statusData", {}).get(
-                "StatusBarSoftwareUpdateSourceVersion", "Unknown"
-            ),
-        }
+        self._attr_device_info = coordinator.device_info
+        self._debouncer = Debouncer() if description.debounce else None
+
+    async def async_added_to_hass(self) -> None:
+        """Follow every poll when transitions are debounced."""
+        await super().async_added_to_hass()
+        if self._debouncer is not None:
+            # Unchanged polls don't update the entity, but still count
+            # towards the debounce.
+            self.async_on_remove(
+                self.coordinator.async_add_poll_listener(self._handle_poll)
+            )
+
+    @callback
+    def _handle_poll(self, data: InseegoM3000Data) -> None:
+        """Feed the debouncer and publish a transition once it is accepted."""
+        options = self.coordinator.noise_filter
+        if options is None:
+            self._debouncer.reset()
+            return
+        previous = self._debouncer.state
+        state = self._debouncer.update(
+            self.entity_description.value_fn(data), options.debounce_polls
+        )
+        if previous is not None and state != previous:
+            self.async_write_ha_state()
 
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
+        if self._debouncer is not None and self._debouncer.state is not None:
+            return self._debouncer.state
         if self.entity_description.value_fn:
             return self.entity_description.value_fn(self.coordinator.data)
         return False
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Flag values restored from storage until a live poll succeeds."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
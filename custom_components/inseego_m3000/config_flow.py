@@ -1,6 +1,7 @@
 """Config flow for Inseego M3000 Hotspot integration."""
 from __future__ import annotations
 
+import ipaddress
 import logging
 from typing import Any
 
@@ -9,11 +10,51 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
+from homeassistant.helpers import discovery_flow
+import homeassistant.helpers.config_validation as cv
 
-from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_TIMEOUT, DOMAIN
+from .api import create_device_session
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_CONNECTIVITY_PROBE,
+    CONF_DEBOUNCE_POLLS,
+    CONF_HOSTS,
+    CONF_LATENCY_INTERVAL,
+    CONF_LATENCY_PROBE,
+    CONF_LATENCY_TARGETS,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_AGE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_HOLD,
+    CONF_NOISE_FILTER,
+    CONF_PROBE_INTERVAL,
+    CONF_RATE_DEADBAND,
+    CONF_RATE_SMOOTHING,
+    CONF_SIGNAL_DEADBAND,
+    CONF_SNR_DEADBAND,
+    CONF_SUBNETS,
+    CONF_USAGE_SCAN_INTERVAL,
+    DEFAULT_DEBOUNCE_POLLS,
+    DEFAULT_DISCOVERY_SUBNETS,
+    DEFAULT_LATENCY_INTERVAL,
+    DEFAULT_LATENCY_TARGETS,
+    DEFAULT_MAX_AGE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_HOLD,
+    DEFAULT_PROBE_INTERVAL,
+    DEFAULT_RATE_DEADBAND,
+    DEFAULT_RATE_SMOOTHING,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SIGNAL_DEADBAND,
+    DEFAULT_SNR_DEADBAND,
+    DEFAULT_USAGE_SCAN_INTERVAL,
+    DOMAIN,
+    STATUS_PATH,
+)
+from .discovery import async_scan, device_info_from_status, hosts_in_subnets
+from .probe import parse_targets
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,26 +70,19 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 async def validate_connection(hass: HomeAssistant, host: str) -> dict[str, Any]:
     """Validate the connection to the Inseego M3000."""
-    session = async_get_clientsession(hass)
-    url = f"http://{host}/srv/status"
+    url = f"http://{host}{STATUS_PATH}"
     
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)) as response:
+        async with create_device_session() as session, session.get(url) as response:
             if response.status != 200:
                 raise ConnectionError(f"HTTP {response.status}")
             
             data = await response.json()
             
             # Validate that this is indeed an Inseego M3000
-            if "statusData" not in data:
+            if (device_info := device_info_from_status(data)) is None:
                 raise ValueError("Invalid response format")
             
-            status_data = data.get("statusData", {})
-            device_info = {
-                "network": status_data.get("statusBarNetwork", "Unknown"),
-                "technology": status_data.get("statusBarTechnology", "Unknown"),
-            }
-            
             return device_info
             
     except aiohttp.ClientError as err:
@@ -64,10 +98,161 @@ class InseegoM3000ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        # Hotspots found by the last scan, or the one discovered by another
+        # flow's scan: host -> network details
+        self._discovered: dict[str, dict[str, str]] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> InseegoM3000OptionsFlow:
+        """Get the options flow for this handler."""
+        return InseegoM3000OptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Let the user scan the network or enter an address."""
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan subnets for hotspots that are not configured yet."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                hosts = hosts_in_subnets(user_input[CONF_SUBNETS])
+            except ValueError:
+                errors[CONF_SUBNETS] = "invalid_subnet"
+            else:
+                configured = self._async_current_ids()
+                found = await async_scan(
+                    host for host in hosts if host not in configured
+                )
+                if found:
+                    self._discovered = dict(
+                        sorted(
+                            found.items(),
+                            key=lambda item: ipaddress.ip_address(item[0]),
+                        )
+                    )
+                    return await self.async_step_select()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SUBNETS,
+                        default=(user_input or {}).get(
+                            CONF_SUBNETS, DEFAULT_DISCOVERY_SUBNETS
+                        ),
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add the hotspots picked from the scan results."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if hosts := user_input[CONF_HOSTS]:
+                # A flow creates a single entry; the other hotspots are
+                # offered as discovered devices, each in its own flow.
+                for host in hosts[1:]:
+                    discovery_flow.async_create_flow(
+                        self.hass,
+                        DOMAIN,
+                        context={
+                            "source": config_entries.SOURCE_INTEGRATION_DISCOVERY
+                        },
+                        data={CONF_HOST: host, **self._discovered[host]},
+                    )
+                return await self._async_create_host_entry(hosts[0])
+            errors["base"] = "no_hosts_selected"
+
+        options = {
+            host: f"{host} ({info['network']}, {info['technology']})"
+            for host, info in self._discovered.items()
+        }
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOSTS, default=list(options)): cv.multi_select(
+                        options
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Handle a hotspot selected from another flow's scan results."""
+        host = discovery_info[CONF_HOST]
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
+        self._discovered = {
+            host: {
+                "network": discovery_info["network"],
+                "technology": discovery_info["technology"],
+            }
+        }
+        self.context["title_placeholders"] = {"host": host}
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm adding a discovered hotspot."""
+        host, info = next(iter(self._discovered.items()))
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                await validate_connection(self.hass, host)
+            except ConnectionError:
+                errors["base"] = "cannot_connect"
+            except ValueError:
+                errors["base"] = "invalid_device"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                return await self._async_create_host_entry(host)
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={"host": host, **info},
+            errors=errors,
+        )
+
+    async def _async_create_host_entry(self, host: str) -> FlowResult:
+        """Create the entry of a discovered hotspot with the default interval."""
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=f"Inseego M3000 ({host})",
+            data={CONF_HOST: host, CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL},
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a manually entered address."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -100,7 +285,166 @@ class InseegoM3000ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class InseegoM3000OptionsFlow(config_entries.OptionsFlow):
+    """Handle options for Inseego M3000 Hotspot."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick the group of options to change."""
+        return self.async_show_menu(
+            step_id="init", menu_options=["polling", "noise_filter", "probes"]
+        )
+
+    def _config(self, user_input: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Return the current settings, with the submitted ones on top."""
+        return {**self._entry.data, **self._entry.options, **(user_input or {})}
+
+    @callback
+    def _async_save(self, user_input: dict[str, Any]) -> FlowResult:
+        """Store the options of one step, keeping those of the others."""
+        return self.async_create_entry(
+            title="", data={**self._entry.options, **user_input}
+        )
+
+    async def async_step_polling(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling intervals and statistics options."""
+        if user_input is not None:
+            return self._async_save(user_input)
+
+        config = self._config()
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SCAN_INTERVAL,
+                    default=config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                vol.Optional(
+                    CONF_USAGE_SCAN_INTERVAL,
+                    default=config.get(
+                        CONF_USAGE_SCAN_INTERVAL, DEFAULT_USAGE_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=config.get(CONF_ADAPTIVE_POLLING, False),
+                ): bool,
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=config.get(
+                        CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(
+                    CONF_RATE_SMOOTHING,
+                    default=config.get(CONF_RATE_SMOOTHING, DEFAULT_RATE_SMOOTHING),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                vol.Optional(
+                    CONF_LONG_TERM_STATISTICS,
+                    default=config.get(CONF_LONG_TERM_STATISTICS, False),
+                ): bool,
+            }
+        )
+
+        return self.async_show_form(step_id="polling", data_schema=schema)
+
+    async def async_step_noise_filter(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the noise filter options."""
+        if user_input is not None:
+            return self._async_save(user_input)
+
+        config = self._config()
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_NOISE_FILTER,
+                    default=config.get(CONF_NOISE_FILTER, False),
+                ): bool,
+                vol.Optional(
+                    CONF_MIN_HOLD,
+                    default=config.get(CONF_MIN_HOLD, DEFAULT_MIN_HOLD),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_DEBOUNCE_POLLS,
+                    default=config.get(CONF_DEBOUNCE_POLLS, DEFAULT_DEBOUNCE_POLLS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                vol.Optional(
+                    CONF_MAX_AGE,
+                    default=config.get(CONF_MAX_AGE, DEFAULT_MAX_AGE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+                vol.Optional(
+                    CONF_SIGNAL_DEADBAND,
+                    default=config.get(CONF_SIGNAL_DEADBAND, DEFAULT_SIGNAL_DEADBAND),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+                vol.Optional(
+                    CONF_SNR_DEADBAND,
+                    default=config.get(CONF_SNR_DEADBAND, DEFAULT_SNR_DEADBAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=20)),
+                vol.Optional(
+                    CONF_RATE_DEADBAND,
+                    default=config.get(CONF_RATE_DEADBAND, DEFAULT_RATE_DEADBAND),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            }
+        )
+
+        return self.async_show_form(step_id="noise_filter", data_schema=schema)
+
+    async def async_step_probes(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the connectivity and latency probe options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                parse_targets(
+                    user_input.get(CONF_LATENCY_TARGETS, DEFAULT_LATENCY_TARGETS)
+                )
+            except ValueError:
+                errors[CONF_LATENCY_TARGETS] = "invalid_targets"
+            else:
+                return self._async_save(user_input)
+
+        config = self._config(user_input)
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_CONNECTIVITY_PROBE,
+                    default=config.get(CONF_CONNECTIVITY_PROBE, False),
+                ): bool,
+                vol.Optional(
+                    CONF_PROBE_INTERVAL,
+                    default=config.get(CONF_PROBE_INTERVAL, DEFAULT_PROBE_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=2, max=60)),
+                vol.Optional(
+                    CONF_LATENCY_PROBE,
+                    default=config.get(CONF_LATENCY_PROBE, False),
+                ): bool,
+                vol.Optional(
+                    CONF_LATENCY_TARGETS,
+                    default=config.get(CONF_LATENCY_TARGETS, DEFAULT_LATENCY_TARGETS),
+                ): str,
+                vol.Optional(
+                    CONF_LATENCY_INTERVAL,
+                    default=config.get(
+                        CONF_LATENCY_INTERVAL, DEFAULT_LATENCY_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            }
+        )
+
+        return self.async_show_form(step_id="probes", data_schema=schema, errors=errors)
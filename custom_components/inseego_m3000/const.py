@@ -2,7 +2,92 @@
 
 DOMAIN = "inseego_m3000"
 DEFAULT_SCAN_INTERVAL = 30  # seconds
+DEFAULT_USAGE_SCAN_INTERVAL = 900  # seconds
+DEFAULT_MAX_SCAN_INTERVAL = 300  # seconds
+DEFAULT_RATE_SMOOTHING = 1  # polls
+DEFAULT_MIN_HOLD = 0  # seconds
+DEFAULT_DEBOUNCE_POLLS = 2
+DEFAULT_MAX_AGE = 900  # seconds
+DEFAULT_SIGNAL_DEADBAND = 1  # bars
+DEFAULT_SNR_DEADBAND = 2  # dB
+DEFAULT_RATE_DEADBAND = 10  # percent of the published rate
 DEFAULT_PORT = 80
 DEFAULT_TIMEOUT = 10
+DEFAULT_CONNECT_TIMEOUT = 3
+
+# Subnet discovery in the config flow
+DEFAULT_DISCOVERY_SUBNETS = "192.168.1.0/24"  # the M3000's default LAN
+DISCOVERY_CONCURRENCY = 128  # hosts probed at once
+DISCOVERY_CONNECT_TIMEOUT = 1  # seconds
+DISCOVERY_TIMEOUT = 3  # seconds per host
+DISCOVERY_MAX_HOSTS = 4096  # a /20
+
+# Per-device HTTP connection pool
+DEVICE_CONNECTION_LIMIT = 2  # status and usage requests in parallel
+DEFAULT_KEEPALIVE_TIMEOUT = 120  # seconds
+
+# Rolling radio/throughput statistics
+STATISTICS_WINDOWS = {"5m": 300, "1h": 3600}  # name: seconds
+STATISTICS_MIN_SAMPLE_INTERVAL = 5  # seconds, sizes the ring buffers
+
+# Circuit breaker for unreachable hotspots
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive failed polls before backing off
+BREAKER_MAX_BACKOFF = 600  # seconds
+BREAKER_PROBE_TIMEOUT = 3  # seconds, half-open probes only request status
+
+# Connectivity probe between full polls
+DEFAULT_PROBE_INTERVAL = 5  # seconds
+PROBE_TIMEOUT = 2  # seconds
+
+# WAN latency prober (DNS queries to public resolvers through the hotspot)
+DEFAULT_LATENCY_TARGETS = "1.1.1.1, 8.8.8.8"
+DEFAULT_LATENCY_PORT = 53
+DEFAULT_LATENCY_INTERVAL = 30  # seconds
+LATENCY_TIMEOUT = 2  # seconds; later replies count as lost
+LATENCY_SAMPLES = 60  # probes kept, across all targets
+
+# Long-term statistics mode: high-rate sensors write their state at most this
+# often while every poll is aggregated into hourly external statistics.
+STATISTICS_STATE_INTERVAL = 300  # seconds
+
+# Usage forecast: no rate is estimated before the samples of a billing
+# cycle span this long
+FORECAST_MIN_SPAN = 6 * 3600  # seconds
+
+# Persisted last-known snapshot, used to start without waiting for the device
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 300  # seconds; at most one write per window
+
+# Per-phase request timings kept for percentiles and diagnostics
+TIMING_SAMPLES = 200
+
+# Fleet-wide poll scheduling (shared by all config entries)
+DATA_FLEET = f"{DOMAIN}_fleet"
+FLEET_MAX_CONCURRENT = 4
+FLEET_JITTER = 2.0  # seconds
+FLEET_LATENCY_SAMPLES = 500
+
+STATUS_PATH = "/srv/status"
+USAGE_PATH = "/apps_home/usageinfo"
+CLIENTS_PATH = "/apps_home/connecteddevicesinfo"
 
 CONF_HOST = "host"
+CONF_SUBNETS = "subnets"
+CONF_HOSTS = "hosts"
+CONF_USAGE_SCAN_INTERVAL = "usage_scan_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_RATE_SMOOTHING = "rate_smoothing"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_NOISE_FILTER = "noise_filter"
+CONF_MIN_HOLD = "min_hold"
+CONF_DEBOUNCE_POLLS = "debounce_polls"
+CONF_MAX_AGE = "max_age"
+CONF_SIGNAL_DEADBAND = "signal_deadband"
+CONF_SNR_DEADBAND = "snr_deadband"
+CONF_RATE_DEADBAND = "rate_deadband"
+CONF_CONNECTIVITY_PROBE = "connectivity_probe"
+CONF_PROBE_INTERVAL = "probe_interval"
+CONF_LATENCY_PROBE = "latency_probe"
+CONF_LATENCY_TARGETS = "latency_targets"
+CONF_LATENCY_INTERVAL = "latency_interval"
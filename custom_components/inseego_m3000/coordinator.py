@@ -1,21 +1,131 @@
 """DataUpdateCoordinator for Inseego M3000."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterable
 from datetime import timedelta
+import hashlib
 import logging
+import time
+from typing import Any, TypeVar
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
-from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_TIMEOUT, DOMAIN
+from .api import create_device_session
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_PROBE_TIMEOUT,
+    CLIENTS_PATH,
+    CONF_ADAPTIVE_POLLING,
+    CONF_CONNECTIVITY_PROBE,
+    CONF_DEBOUNCE_POLLS,
+    CONF_LATENCY_INTERVAL,
+    CONF_LATENCY_PROBE,
+    CONF_LATENCY_TARGETS,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_AGE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_HOLD,
+    CONF_NOISE_FILTER,
+    CONF_PROBE_INTERVAL,
+    CONF_RATE_DEADBAND,
+    CONF_RATE_SMOOTHING,
+    CONF_SIGNAL_DEADBAND,
+    CONF_SNR_DEADBAND,
+    CONF_USAGE_SCAN_INTERVAL,
+    DEFAULT_DEBOUNCE_POLLS,
+    DEFAULT_LATENCY_INTERVAL,
+    DEFAULT_LATENCY_TARGETS,
+    DEFAULT_MAX_AGE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_HOLD,
+    DEFAULT_PROBE_INTERVAL,
+    DEFAULT_RATE_DEADBAND,
+    DEFAULT_RATE_SMOOTHING,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SIGNAL_DEADBAND,
+    DEFAULT_SNR_DEADBAND,
+    DEFAULT_TIMEOUT,
+    DEFAULT_USAGE_SCAN_INTERVAL,
+    DOMAIN,
+    FORECAST_MIN_SPAN,
+    STATISTICS_MIN_SAMPLE_INTERVAL,
+    STATISTICS_WINDOWS,
+    STATUS_PATH,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TIMING_SAMPLES,
+    USAGE_PATH,
+)
+from .metrics import (
+    EndpointStats,
+    Histogram,
+    LifetimeCounters,
+    PhaseTimings,
+    RollingStatistics,
+    ThroughputTracker,
+    UsageForecaster,
+)
+from .models import (
+    CLIENT_COUNT_FIELDS,
+    ClientSnapshot,
+    InseegoM3000Data,
+    StatusSnapshot,
+    ThroughputRates,
+    UsageForecast,
+    UsageSnapshot,
+    changed_fields,
+    data_from_dict,
+    data_to_dict,
+    parse_clients,
+    parse_status,
+    parse_usage,
+    reported_status_fields,
+    reported_usage_fields,
+)
+from .external_statistics import HourlyStatistics
+from .filters import NoiseFilterOptions
+from .fleet import PRIORITY_HIGH, PRIORITY_NORMAL, InseegoM3000Fleet
+from .probe import ConnectivityProbe, LatencyProber, parse_targets
+from .scheduler import AdaptivePollingPolicy, CircuitBreaker
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Metrics kept in rolling windows: (InseegoM3000Data section, field, buckets)
+STATISTICS_METRICS: dict[str, tuple[str, Histogram]] = {
+    "signal_bars": ("status", Histogram.linear(0, 5, 1)),
+    "snr": ("status", Histogram.linear(-20, 50, 1)),
+    "rx_rate": ("rates", Histogram.exponential(100, 1e9)),
+    "tx_rate": ("rates", Histogram.exponential(100, 1e9)),
+}
+
+
+class HttpStatusError(UpdateFailed):
+    """An endpoint answered with a status other than 200 or 304."""
+
+    def __init__(self, status: int) -> None:
+        """Initialize with the HTTP status."""
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the last known snapshot of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
 
 class InseegoM3000DataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Inseego M3000 data."""
@@ -23,53 +133,781 @@ class InseegoM3000DataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize."""
         self.host = entry.data[CONF_HOST]
-        self.session = async_get_clientsession(hass)
-        
-        scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-        
+        self.session = create_device_session()
+        self.usage_interval = timedelta(seconds=DEFAULT_USAGE_SCAN_INTERVAL)
+        self._usage_fetched_at: float | None = None
+        # Snapshot fields changed by the last refresh; None means every
+        # listener must be updated (first data, failures and recoveries).
+        self.changed_keys: frozenset[str] | None = None
+        # Snapshot fields the device has included in any response so far.
+        # Only replaced (never mutated) when it grows, so listeners can
+        # detect new capabilities with an identity check.
+        self.reported_fields: frozenset[str] = frozenset()
+        # True while self.data was restored from storage and no live poll
+        # has succeeded yet.
+        self.stale = False
+        # Incremented whenever self.data is replaced by a new snapshot.
+        self.generation = 0
+        self._derived: dict[Callable[[InseegoM3000Data], Any], Any] = {}
+        self._derived_generation = -1
+        self._device_info: dict[str, Any] | None = None
+        self._store = snapshot_store(hass, entry.entry_id)
+        self._save_scheduled_at: float | None = None
+        # Per-endpoint fingerprint of the last successfully processed body
+        # and the HTTP cache validators (ETag/Last-Modified) the device sent
+        # with it. Validators of a response are only kept once its body has
+        # been processed, so a 304 always refers to a body that parsed.
+        self._fingerprints: dict[str, bytes] = {}
+        self._validators: dict[str, dict[str, str]] = {}
+        self._received_validators: dict[str, dict[str, str]] = {}
+        self.polls_skipped = 0
+        self.polls_processed = 0
+        self.endpoint_stats = {
+            STATUS_PATH: EndpointStats(TIMING_SAMPLES),
+            USAGE_PATH: EndpointStats(TIMING_SAMPLES),
+            CLIENTS_PATH: EndpointStats(TIMING_SAMPLES),
+        }
+        # Client counts of the status the client list was last fetched for
+        self._client_counts: tuple[int, ...] | None = None
+        # "queue" (waiting for a fleet slot), "poll" (requests and parsing)
+        # and "fan_out" (entity updates) durations.
+        self.poll_timings = PhaseTimings(TIMING_SAMPLES)
+        self.scan_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        self._adaptive_policy: AdaptivePollingPolicy | None = None
+        self.long_term_statistics: HourlyStatistics | None = None
+        self.noise_filter: NoiseFilterOptions | None = None
+        self.probe: ConnectivityProbe | None = None
+        self.latency: LatencyProber | None = None
+        # Host of another hotspot whose latency probes leave through the same
+        # interface, so both report the same link.
+        self.shared_route: str | None = None
+        # Called with the new data after every successful poll, including
+        # polls whose data was unchanged and did not update the listeners.
+        self._poll_listeners: list[Callable[[InseegoM3000Data], None]] = []
+        # Called after every round of the latency prober.
+        self._latency_listeners: list[CALLBACK_TYPE] = []
+        # Called once every refresh has finished, successful or not.
+        self._refresh_listeners: list[CALLBACK_TYPE] = []
+        self.breaker = CircuitBreaker(
+            DEFAULT_SCAN_INTERVAL, BREAKER_MAX_BACKOFF, BREAKER_FAILURE_THRESHOLD
+        )
+        # Set by InseegoM3000Fleet.register()
+        self.fleet: InseegoM3000Fleet | None = None
+        self._poll_priority = PRIORITY_HIGH
+        self._throughput = ThroughputTracker()
+        self._lifetime = LifetimeCounters()
+        self._forecaster = UsageForecaster(FORECAST_MIN_SPAN)
+        self.statistics = {
+            metric: RollingStatistics(
+                STATISTICS_WINDOWS, histogram, STATISTICS_MIN_SAMPLE_INTERVAL
+            )
+            for metric, (_, histogram) in STATISTICS_METRICS.items()
+        }
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            always_update=False,
         )
+        self.async_apply_options(entry)
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data from the Inseego M3000."""
-        status_url = f"http://{self.host}/srv/status"
-        usage_url = f"http://{self.host}/apps_home/usageinfo"
-        
+    @callback
+    def async_apply_options(self, entry: ConfigEntry) -> None:
+        """Apply the polling intervals from the config entry.
+
+        Options take precedence over the values entered during setup, so the
+        intervals can be changed at runtime without reloading the entry.
+        """
+        config = {**entry.data, **entry.options}
+        self.scan_interval = timedelta(
+            seconds=config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.update_interval = self.scan_interval
+        self.breaker.base_delay = self.scan_interval.total_seconds()
+        self.usage_interval = timedelta(
+            seconds=config.get(CONF_USAGE_SCAN_INTERVAL, DEFAULT_USAGE_SCAN_INTERVAL)
+        )
+        if config.get(CONF_ADAPTIVE_POLLING, False):
+            self._adaptive_policy = AdaptivePollingPolicy(
+                self.scan_interval.total_seconds(),
+                config.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+            )
+        else:
+            self._adaptive_policy = None
+        self._throughput = ThroughputTracker(
+            config.get(CONF_RATE_SMOOTHING, DEFAULT_RATE_SMOOTHING)
+        )
+        if not config.get(CONF_LONG_TERM_STATISTICS, False):
+            self.long_term_statistics = None
+        elif self.long_term_statistics is None:
+            self.long_term_statistics = HourlyStatistics(self.hass, self.host)
+        if config.get(CONF_NOISE_FILTER, False):
+            self.noise_filter = NoiseFilterOptions(
+                min_hold=config.get(CONF_MIN_HOLD, DEFAULT_MIN_HOLD),
+                debounce_polls=config.get(CONF_DEBOUNCE_POLLS, DEFAULT_DEBOUNCE_POLLS),
+                max_age=config.get(CONF_MAX_AGE, DEFAULT_MAX_AGE),
+                deadbands={
+                    CONF_SIGNAL_DEADBAND: config.get(
+                        CONF_SIGNAL_DEADBAND, DEFAULT_SIGNAL_DEADBAND
+                    ),
+                    CONF_SNR_DEADBAND: config.get(
+                        CONF_SNR_DEADBAND, DEFAULT_SNR_DEADBAND
+                    ),
+                    CONF_RATE_DEADBAND: config.get(
+                        CONF_RATE_DEADBAND, DEFAULT_RATE_DEADBAND
+                    )
+                    / 100,
+                },
+            )
+        else:
+            self.noise_filter = None
+        # Targets of the latency probe and of the probe's WAN check
         try:
-            # Fetch status data
-            async with self.session.get(
-                status_url, timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-            ) as response:
-                if response.status != 200:
-                    raise UpdateFailed(f"HTTP {response.status}")
-                
-                status_data = await response.json()
-                
-                if "statusData" not in status_data:
-                    raise UpdateFailed("Invalid status response format")
-            
-            # Fetch usage data
-            usage_data = {}
-            try:
-                async with self.session.get(
-                    usage_url, timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
-                ) as response:
-                    if response.status == 200:
-                        usage_data = await response.json()
-            except Exception as err:
-                _LOGGER.debug("Usage data not available: %s", err)
-            
-            # Combine both datasets
-            return {
-                **status_data,
-                "usageData": usage_data
+            targets = parse_targets(
+                config.get(CONF_LATENCY_TARGETS, DEFAULT_LATENCY_TARGETS)
+            )
+        except ValueError as err:
+            targets = []
+            if config.get(CONF_CONNECTIVITY_PROBE) or config.get(CONF_LATENCY_PROBE):
+                _LOGGER.warning(
+                    "Latency probe and WAN check disabled for %s: %s", self.host, err
+                )
+        if self.probe is not None:
+            self.probe.async_stop()
+            self.probe = None
+        if config.get(CONF_CONNECTIVITY_PROBE, False):
+            self.probe = ConnectivityProbe(
+                self,
+                config.get(CONF_PROBE_INTERVAL, DEFAULT_PROBE_INTERVAL),
+                targets,
+            )
+            self.probe.async_start()
+        if self.latency is not None:
+            self.latency.async_stop()
+            self.latency = None
+        if config.get(CONF_LATENCY_PROBE, False) and targets:
+            self.latency = LatencyProber(
+                self.hass,
+                f"Inseego M3000 latency {self.host}",
+                targets,
+                config.get(CONF_LATENCY_INTERVAL, DEFAULT_LATENCY_INTERVAL),
+                self._notify_latency,
+                via=self.host,
+            )
+            self.latency.async_start()
+
+    def _adapt_interval(
+        self, changed_keys: frozenset[str] | None, status: StatusSnapshot
+    ) -> None:
+        """Let the adaptive policy pick the interval for the next poll."""
+        if self._adaptive_policy is None:
+            return
+        seconds = self._adaptive_policy.next_interval(changed_keys, status)
+        if seconds != self.update_interval.total_seconds():
+            _LOGGER.debug("Adjusting %s poll interval to %ss", self.host, seconds)
+            self.update_interval = timedelta(seconds=seconds)
+
+    async def async_restore(self) -> bool:
+        """Load the last known snapshot; return True if one was restored."""
+        if not (stored := await self._store.async_load()):
+            return False
+        self._lifetime.restore(stored.get("lifetime"))
+        if (data := data_from_dict(stored)) is None:
+            _LOGGER.debug("Ignoring incompatible stored snapshot for %s", self.host)
+            return False
+        data.lifetime = self._lifetime.totals()
+        self._forecaster.restore(stored.get("forecast"))
+        data.forecast = self._forecaster.project(dt_util.now(), data.usage)
+        self.data = data
+        self.generation += 1
+        self.reported_fields = frozenset(stored.get("reported_fields", ()))
+        self.stale = True
+        return True
+
+    @callback
+    def derived(self, compute: Callable[[InseegoM3000Data], _T]) -> _T:
+        """Return compute(self.data), computed at most once per snapshot.
+
+        Entities of every platform share the result, so attribute sets used by
+        several entities are only built once per poll.
+        """
+        if self._derived_generation != self.generation:
+            self._derived.clear()
+            self._derived_generation = self.generation
+        try:
+            return self._derived[compute]
+        except KeyError:
+            value = self._derived[compute] = compute(self.data)
+            return value
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return the device info shared by all entities of this hotspot."""
+        sw_version = self.data.status.sw_version
+        if self._device_info is None or self._device_info["sw_version"] != sw_version:
+            self._device_info = {
+                "identifiers": {(DOMAIN, self.host)},
+                "name": f"Inseego M3000 ({self.host})",
+                "manufacturer": "Inseego",
+                "model": "M3000",
+                "sw_version": sw_version,
             }
-                
+        return self._device_info
+
+    @callback
+    def _schedule_save(self) -> None:
+        """Persist the current snapshot, batching changes into one write.
+
+        The first change starts a STORAGE_SAVE_DELAY window; the write at
+        its end stores whatever data is current then. Home Assistant also
+        flushes pending writes on shutdown.
+        """
+        now = time.monotonic()
+        if (
+            self._save_scheduled_at is not None
+            and now - self._save_scheduled_at < STORAGE_SAVE_DELAY
+        ):
+            return
+        self._save_scheduled_at = now
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_store(self) -> dict:
+        """Return the data to persist."""
+        return {
+            **data_to_dict(self.data),
+            "reported_fields": sorted(self.reported_fields),
+            "lifetime": self._lifetime.as_dict(),
+            "forecast": self._forecaster.as_dict(),
+        }
+
+    async def async_close(self) -> None:
+        """Stop the probes and close the device session."""
+        if self.probe is not None:
+            self.probe.async_stop()
+        if self.latency is not None:
+            self.latency.async_stop()
+        await self.session.close()
+
+    @callback
+    def async_add_poll_listener(
+        self, poll_callback: Callable[[InseegoM3000Data], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for every successful poll; return a function to stop."""
+        self._poll_listeners.append(poll_callback)
+
+        @callback
+        def remove_poll_listener() -> None:
+            self._poll_listeners.remove(poll_callback)
+
+        return remove_poll_listener
+
+    @callback
+    def _notify_poll(self, data: InseegoM3000Data) -> None:
+        """Call the poll listeners."""
+        for poll_callback in list(self._poll_listeners):
+            poll_callback(data)
+
+    @callback
+    def async_add_latency_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for new latency measurements; return a function to stop."""
+        self._latency_listeners.append(update_callback)
+
+        @callback
+        def remove_latency_listener() -> None:
+            self._latency_listeners.remove(update_callback)
+
+        return remove_latency_listener
+
+    @callback
+    def _notify_latency(self) -> None:
+        """Call the latency listeners."""
+        self._check_shared_route()
+        for update_callback in list(self._latency_listeners):
+            update_callback()
+
+    def _check_shared_route(self) -> None:
+        """Warn once when another hotspot's latency probes share our route."""
+        shared = None
+        if self.latency is not None and self.latency.route is not None:
+            # The interface if it is known, else the local address
+            path = self.latency.route[1] or self.latency.route[0]
+            shared = next(
+                (
+                    other.host
+                    for other in (self.fleet.coordinators if self.fleet else ())
+                    if other is not self
+                    and other.latency is not None
+                    and other.latency.route is not None
+                    and (other.latency.route[1] or other.latency.route[0]) == path
+                ),
+                None,
+            )
+            if shared is not None and shared != self.shared_route:
+                _LOGGER.warning(
+                    "The latency probes of %s and %s both leave through %s, so"
+                    " their WAN sensors measure the same link; give each"
+                    " hotspot its own network interface",
+                    self.host,
+                    shared,
+                    path,
+                )
+        self.shared_route = shared
+
+    @callback
+    def async_add_refresh_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for the end of every refresh; return a function to stop.
+
+        Unlike the coordinator listeners, these are also called after polls
+        that changed nothing and after repeated failures, once the outcome
+        (last_update_success) has been recorded.
+        """
+        self._refresh_listeners.append(update_callback)
+
+        @callback
+        def remove_refresh_listener() -> None:
+            self._refresh_listeners.remove(update_callback)
+
+        return remove_refresh_listener
+
+    @callback
+    def _notify_refresh(self) -> None:
+        """Call the refresh listeners."""
+        for update_callback in list(self._refresh_listeners):
+            update_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose snapshot fields changed.
+
+        Entities register their description keys as the listener context;
+        listeners without a context are updated on every refresh.
+        """
+        started = time.perf_counter()
+        changed = self.changed_keys
+        if changed is None:
+            super().async_update_listeners()
+        else:
+            for update_callback, context in list(self._listeners.values()):
+                if context is None or not changed.isdisjoint(context):
+                    update_callback()
+        self.poll_timings.record("fan_out", time.perf_counter() - started)
+
+    def is_reported(self, keys: tuple[str, ...]) -> bool:
+        """Return True if the device reports the field an entity is built on.
+
+        The first key of an entity description is the one its value is read
+        from; descriptions without keys are always supported.
+        """
+        return not keys or keys[0] in self.reported_fields
+
+    @callback
+    def async_add_reported_entities(
+        self,
+        descriptions: Iterable[EntityDescription],
+        create_entity: Callable[[Any], Entity],
+        async_add_entities: AddEntitiesCallback,
+    ) -> CALLBACK_TYPE:
+        """Add an entity for every description whose field the device reports.
+
+        Entities for fields that show up later (e.g. after a firmware update)
+        are added then. Returns a function to stop listening.
+        """
+        pending = list(descriptions)
+        checked: frozenset[str] | None = None
+
+        @callback
+        def _async_add_reported() -> None:
+            nonlocal pending, checked
+            if self.reported_fields is checked or not pending:
+                return
+            checked = self.reported_fields
+            supported = [d for d in pending if self.is_reported(d.keys)]
+            if supported:
+                pending = [d for d in pending if d not in supported]
+                async_add_entities(create_entity(d) for d in supported)
+
+        _async_add_reported()
+        return self.async_add_listener(_async_add_reported)
+
+    def _add_reported_fields(self, fields: frozenset[str]) -> None:
+        """Record the fields of a parsed response."""
+        if not fields <= self.reported_fields:
+            self.reported_fields = self.reported_fields | fields
+
+    def _usage_due(self) -> bool:
+        """Return True if the usage endpoint should be polled this cycle."""
+        if self._usage_fetched_at is None:
+            return True
+        elapsed = time.monotonic() - self._usage_fetched_at
+        return elapsed >= self.usage_interval.total_seconds()
+
+    async def _async_fetch(self, path: str) -> bytes | None:
+        """Fetch the raw body of an endpoint and record its phase timings.
+
+        Returns None when the device answers a conditional request with
+        304 Not Modified.
+        """
+        stats = self.endpoint_stats[path]
+        headers: dict[str, str] = {}
+        validators = self._validators.get(path)
+        if validators:
+            if etag := validators.get("ETag"):
+                headers["If-None-Match"] = etag
+            if last_modified := validators.get("Last-Modified"):
+                headers["If-Modified-Since"] = last_modified
+
+        # Filled in with the connect time by the session's trace config.
+        trace: dict[str, float] = {}
+        started = time.perf_counter()
+        async with self.session.get(
+            f"http://{self.host}{path}", headers=headers, trace_request_ctx=trace
+        ) as response:
+            headers_at = time.perf_counter()
+            stats.timings.record("ttfb", headers_at - started)
+            if "connect" in trace:
+                stats.timings.record("connect", trace["connect"])
+            if response.status == 304:
+                stats.not_modified += 1
+                return None
+            if response.status != 200:
+                raise HttpStatusError(response.status)
+            self._received_validators[path] = {
+                name: response.headers[name]
+                for name in ("ETag", "Last-Modified")
+                if name in response.headers
+            }
+            body = await response.read()
+
+        finished = time.perf_counter()
+        stats.timings.record("download", finished - headers_at)
+        stats.timings.record("request", finished - started)
+        stats.last_payload_size = len(body)
+        return body
+
+    def _is_unchanged(self, path: str, body: bytes | None) -> bool:
+        """Return True if the body matches the one processed last poll."""
+        if body is None:
+            return path in self._fingerprints
+        return self._fingerprints.get(path) == hashlib.blake2b(
+            body, digest_size=16
+        ).digest()
+
+    def _remember(self, path: str, body: bytes | None) -> None:
+        """Record the fingerprint and validators of a successfully processed body.
+
+        Bodies that could not be parsed are not remembered, so the same
+        invalid body is parsed (and counted as a failure) again next time.
+        """
+        if body is not None:
+            self._fingerprints[path] = hashlib.blake2b(body, digest_size=16).digest()
+            self._validators[path] = self._received_validators.pop(path, {})
+
+    def _breaker_failed(self) -> None:
+        """Count a failed poll and back off while the breaker is open.
+
+        The Connection Breaker sensor follows every change through the
+        refresh listeners, as the coordinator listeners are not updated for
+        repeated failures.
+        """
+        if (backoff := self.breaker.record_failure()) is None:
+            return
+        _LOGGER.debug("%s unreachable, next probe in %.0fs", self.host, backoff)
+        self.update_interval = timedelta(seconds=backoff)
+
+    def _breaker_succeeded(self) -> None:
+        """Return to the normal cadence after a successful probe."""
+        if self.breaker.record_success():
+            _LOGGER.debug("%s reachable again", self.host)
+            self.update_interval = self.scan_interval
+
+    async def _async_update_data(self) -> InseegoM3000Data:
+        """Fetch data from the Inseego M3000."""
+        self.changed_keys = None
+        self.breaker.before_poll()
+        try:
+            if self.fleet is None:
+                return await self._async_timed_poll()
+
+            started = time.perf_counter()
+            async with self.fleet.slot(self._poll_priority):
+                self.poll_timings.record("queue", time.perf_counter() - started)
+                data = await self._async_timed_poll()
+        except UpdateFailed:
+            self._breaker_failed()
+            # Retry failed devices first, but don't let the probes of a
+            # device that is known to be down delay healthy ones.
+            self._poll_priority = (
+                PRIORITY_HIGH if self.breaker.closed else PRIORITY_NORMAL
+            )
+            raise
+        finally:
+            # The refresh records its outcome right after this returns.
+            self.hass.loop.call_soon(self._notify_refresh)
+        self._poll_priority = (
+            PRIORITY_HIGH if data is not self.data else PRIORITY_NORMAL
+        )
+        return data
+
+    async def _async_timed_poll(self) -> InseegoM3000Data:
+        """Poll the device and record how long it took."""
+        started = time.perf_counter()
+        try:
+            return await self._async_poll()
+        finally:
+            self.poll_timings.record("poll", time.perf_counter() - started)
+
+    async def _async_poll(self) -> InseegoM3000Data:
+        """Request both endpoints and build the next snapshot."""
+        # Both endpoints are requested in parallel and share one deadline, so
+        # a poll takes as long as the slower of the two round trips. Billing
+        # data changes rarely and is only requested on its own, slower cadence.
+        # Probes of a device that has been failing only request the status,
+        # with a shorter deadline.
+        probe = not self.breaker.closed
+        timeout = BREAKER_PROBE_TIMEOUT if probe else DEFAULT_TIMEOUT
+        deadline = asyncio.get_running_loop().time() + timeout
+        tasks = [asyncio.ensure_future(self._async_fetch(STATUS_PATH))]
+        usage_requested_at = time.monotonic()
+        if not probe and self._usage_due():
+            tasks.append(asyncio.ensure_future(self._async_fetch(USAGE_PATH)))
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        status_task = tasks[0]
+        usage_task = tasks[1] if len(tasks) > 1 else None
+
+        # Usage data is optional; when it is not due or the request failed,
+        # keep the last known values so the billing sensors don't drop to zero.
+        usage = self.data.usage if self.data else parse_usage({})
+        usage_fetched = False
+        usage_stats = self.endpoint_stats[USAGE_PATH]
+        if usage_task in pending:
+            usage_stats.timeouts += 1
+            _LOGGER.debug("Usage data not available: timed out")
+        elif usage_task is not None and usage_task.exception() is not None:
+            usage_stats.failures += 1
+            _LOGGER.debug("Usage data not available: %s", usage_task.exception())
+        elif usage_task is not None:
+            body = usage_task.result()
+            parsed: UsageSnapshot | None = usage
+            if self.data is None or not self._is_unchanged(USAGE_PATH, body):
+                started = time.perf_counter()
+                parsed = self._parse_usage_body(body)
+                usage_stats.timings.record("decode", time.perf_counter() - started)
+            if parsed is None:
+                usage_stats.failures += 1
+            else:
+                self._remember(USAGE_PATH, body)
+                usage = parsed
+                usage_fetched = True
+                usage_stats.successes += 1
+                # Failed requests are retried on the next poll.
+                self._usage_fetched_at = usage_requested_at
+
+        status_stats = self.endpoint_stats[STATUS_PATH]
+        if status_task in pending:
+            status_stats.timeouts += 1
+            raise UpdateFailed(
+                f"Timed out communicating with device after {timeout}s"
+            )
+
+        try:
+            body = status_task.result()
+            received_at = time.monotonic()
+        except UpdateFailed:
+            status_stats.failures += 1
+            raise
         except aiohttp.ClientError as err:
+            status_stats.failures += 1
             raise UpdateFailed(f"Error communicating with device: {err}")
         except Exception as err:
+            status_stats.failures += 1
             raise UpdateFailed(f"Unexpected error: {err}")
+
+        # Byte-identical (or 304) responses reuse the previous snapshots, so
+        # decoding and the entity fan-out are skipped entirely.
+        if self.data is not None and self._is_unchanged(STATUS_PATH, body):
+            status = self.data.status
+        else:
+            started = time.perf_counter()
+            try:
+                status = self._parse_status_body(body)
+            except UpdateFailed:
+                status_stats.failures += 1
+                raise
+            finally:
+                status_stats.timings.record("decode", time.perf_counter() - started)
+        self._remember(STATUS_PATH, body)
+        status_stats.successes += 1
+        self._breaker_succeeded()
+        was_stale = self.stale
+        self.stale = False
+        clients = await self._async_update_clients(
+            status, self.data.clients if self.data else {}, deadline
+        )
+        # Every usage response is a sample, including unchanged ones: a flat
+        # stretch lowers the estimated rate.
+        previous_forecast = self.data.forecast if self.data else UsageForecast()
+        forecast = previous_forecast
+        if usage_fetched:
+            forecast = self._forecaster.add(dt_util.now(), usage)
+            # Keep the previous object when nothing changed (e.g. before the
+            # samples span enough time), so the poll can still be skipped.
+            if forecast == previous_forecast:
+                forecast = previous_forecast
+        # An unchanged status is an interval in which the counters did not
+        # move, so the rates drop towards zero rather than repeating.
+        previous_rates = self.data.rates if self.data else ThroughputRates()
+        rates = self._throughput.update(received_at, status)
+        if rates == previous_rates:
+            rates = previous_rates
+
+        if (
+            not was_stale
+            and self.data is not None
+            and status is self.data.status
+            and usage is self.data.usage
+            and clients is self.data.clients
+            and forecast is self.data.forecast
+            and rates is self.data.rates
+        ):
+            self.polls_skipped += 1
+            self._adapt_interval(frozenset(), status)
+            self._record_statistics(received_at, self.data)
+            self._notify_poll(self.data)
+            return self.data
+
+        self.polls_processed += 1
+        if self.data is not None and status is self.data.status:
+            lifetime = self.data.lifetime
+        else:
+            lifetime = self._lifetime.update(status, dt_util.utcnow().timestamp())
+        data = InseegoM3000Data(
+            status=status,
+            usage=usage,
+            rates=rates,
+            lifetime=lifetime,
+            forecast=forecast,
+            clients=clients,
+        )
+        # After a restore every entity is updated once, to drop the stale flag.
+        if self.data is not None and self.last_update_success and not was_stale:
+            self.changed_keys = changed_fields(self.data, data)
+        self._adapt_interval(self.changed_keys, status)
+        self._record_statistics(received_at, data)
+        self._schedule_save()
+        self.generation += 1
+        self._notify_poll(data)
+        return data
+
+    async def _async_update_clients(
+        self,
+        status: StatusSnapshot,
+        clients: dict[str, ClientSnapshot],
+        deadline: float,
+    ) -> dict[str, ClientSnapshot]:
+        """Request the client list again if a client count changed.
+
+        The request shares the poll's ``deadline`` (event loop time). It is
+        retried on the next polls after a timeout or a network or server
+        error, but not after a client error (e.g. 404 on firmware without
+        the endpoint) or an invalid body, until a count changes again. When
+        the list is unchanged or can't be fetched, ``clients`` (the previous
+        list, the same object) is returned.
+        """
+        counts = tuple(getattr(status, field) for field in CLIENT_COUNT_FIELDS)
+        if counts == self._client_counts:
+            return clients
+
+        stats = self.endpoint_stats[CLIENTS_PATH]
+        try:
+            async with asyncio.timeout_at(deadline):
+                body = await self._async_fetch(CLIENTS_PATH)
+        except TimeoutError:
+            stats.timeouts += 1
+            _LOGGER.debug("Client list not available: timed out")
+            return clients
+        except (aiohttp.ClientError, UpdateFailed) as err:
+            stats.failures += 1
+            _LOGGER.debug("Client list not available: %s", err)
+            if isinstance(err, HttpStatusError) and 400 <= err.status < 500:
+                self._client_counts = counts
+            return clients
+
+        if self._is_unchanged(CLIENTS_PATH, body):
+            self._remember(CLIENTS_PATH, body)
+            stats.successes += 1
+            self._client_counts = counts
+            return clients
+        started = time.perf_counter()
+        parsed = self._parse_clients_body(body)
+        stats.timings.record("decode", time.perf_counter() - started)
+        if parsed is None:
+            stats.failures += 1
+            self._client_counts = counts
+            return clients
+        self._remember(CLIENTS_PATH, body)
+        stats.successes += 1
+        self._client_counts = counts
+        return clients if parsed == clients else parsed
+
+    def _record_statistics(self, timestamp: float, data: InseegoM3000Data) -> None:
+        """Add the metrics of a successful poll to the rolling windows."""
+        for metric, (section, _) in STATISTICS_METRICS.items():
+            value = getattr(getattr(data, section), metric)
+            if value is not None:
+                self.statistics[metric].add(timestamp, value)
+        if self.long_term_statistics is not None:
+            self.long_term_statistics.add(dt_util.utcnow(), data)
+
+    def _parse_status_body(self, body: bytes | None) -> StatusSnapshot:
+        """Decode and validate a /srv/status body."""
+        try:
+            payload = json_loads(body)
+        except (TypeError, ValueError) as err:
+            raise UpdateFailed(f"Invalid status response: {err}")
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("statusData"), dict
+        ):
+            raise UpdateFailed("Invalid status response format")
+        self._add_reported_fields(reported_status_fields(payload))
+        return parse_status(payload)
+
+    def _parse_usage_body(self, body: bytes | None) -> UsageSnapshot | None:
+        """Decode a /apps_home/usageinfo body, or None if it is invalid."""
+        try:
+            payload = json_loads(body)
+        except (TypeError, ValueError) as err:
+            _LOGGER.debug("Usage data not available: %s", err)
+            return None
+        if not isinstance(payload, dict):
+            _LOGGER.debug("Usage data not available: invalid response format")
+            return None
+        self._add_reported_fields(reported_usage_fields(payload))
+        return parse_usage(payload)
+
+    def _parse_clients_body(
+        self, body: bytes | None
+    ) -> dict[str, ClientSnapshot] | None:
+        """Decode a connected client list body, or None if it is invalid."""
+        try:
+            payload = json_loads(body)
+        except (TypeError, ValueError) as err:
+            _LOGGER.debug("Client list not available: %s", err)
+            return None
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("connectedDevices"), list
+        ):
+            _LOGGER.debug("Client list not available: invalid response format")
+            return None
+        return parse_clients(payload)
@@ -0,0 +1,126 @@
+"""Device tracker platform for the clients of an Inseego M3000 Hotspot."""
+from __future__ import annotations
+
+from homeassistant.components.device_tracker import ScannerEntity, SourceType
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import InseegoM3000DataUpdateCoordinator
+from .models import CLIENTS_KEY, ClientSnapshot, client_key
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up a tracker for every client seen on the hotspot."""
+    coordinator: InseegoM3000DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # Clients tracked before a restart get their entity back right away, so
+    # they show as away instead of disappearing until they reconnect.
+    prefix = f"{coordinator.host}_"
+    tracked = {
+        registry_entry.unique_id.removeprefix(prefix)
+        for registry_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if registry_entry.domain == Platform.DEVICE_TRACKER
+        and registry_entry.unique_id.startswith(prefix)
+    }
+    # A list, not a generator: ``tracked`` grows below before the platform
+    # iterates the entities.
+    async_add_entities(
+        [InseegoM3000ClientTracker(coordinator, mac_address) for mac_address in tracked]
+    )
+
+    # Only joins of clients that never had an entity create new ones; the
+    # listener only runs when the client list changed.
+    @callback
+    def _async_add_new_clients() -> None:
+        if new := coordinator.data.clients.keys() - tracked:
+            tracked.update(new)
+            async_add_entities(
+                InseegoM3000ClientTracker(coordinator, mac_address)
+                for mac_address in new
+            )
+
+    _async_add_new_clients()
+    entry.async_on_unload(
+        coordinator.async_add_listener(
+            _async_add_new_clients, frozenset({CLIENTS_KEY})
+        )
+    )
+
+
+class InseegoM3000ClientTracker(CoordinatorEntity, ScannerEntity):
+    """A client of the hotspot; home while it is in the client list."""
+
+    def __init__(
+        self, coordinator: InseegoM3000DataUpdateCoordinator, mac_address: str
+    ) -> None:
+        """Initialize the tracker."""
+        # Only updated when this client joins, leaves or changes (and on
+        # failures and recoveries, like every entity).
+        super().__init__(coordinator, context=frozenset({client_key(mac_address)}))
+        self._mac_address = mac_address
+        # The last known details, kept while the client is away
+        self._client: ClientSnapshot | None = coordinator.data.clients.get(
+            mac_address
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Remember the client's latest details."""
+        if (client := self.coordinator.data.clients.get(self._mac_address)) is not None:
+            self._client = client
+        super()._handle_coordinator_update()
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID; a client may roam between several hotspots."""
+        return f"{self.coordinator.host}_{self._mac_address}"
+
+    @property
+    def name(self) -> str:
+        """Return the client's host name, or its MAC address."""
+        return self.hostname or self._mac_address
+
+    @property
+    def source_type(self) -> SourceType:
+        """Return the source type of the tracker."""
+        return SourceType.ROUTER
+
+    @property
+    def is_connected(self) -> bool:
+        """Return true if the client is connected to the hotspot."""
+        return self._mac_address in self.coordinator.data.clients
+
+    @property
+    def mac_address(self) -> str:
+        """Return the client's MAC address."""
+        return self._mac_address
+
+    @property
+    def ip_address(self) -> str | None:
+        """Return the client's last known IP address."""
+        return self._client.ip_address if self._client else None
+
+    @property
+    def hostname(self) -> str | None:
+        """Return the client's host name, if it reported one."""
+        if self._client is None or self._client.name in ("", "Unknown"):
+            return None
+        return self._client.name
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Return how the client is connected."""
+        if self._client is None:
+            return None
+        return {"connection_type": self._client.connection_type}
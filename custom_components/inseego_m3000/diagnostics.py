@@ -0,0 +1,70 @@
+"""Diagnostics support for Inseego M3000."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import InseegoM3000DataUpdateCoordinator
+from .models import InseegoM3000Data
+
+TO_REDACT = {
+    CONF_HOST,
+    "ip_address",
+    "ipv6_address",
+    "gateway",
+    "mac_address",
+    "name",
+    "source_address",
+}
+
+
+def _data_to_dict(data: InseegoM3000Data) -> dict[str, Any]:
+    """Return the snapshots, with the clients as a list (their keys are MACs)."""
+    result = asdict(data)
+    result["clients"] = list(result["clients"].values())
+    return result
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: InseegoM3000DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "usage_interval": coordinator.usage_interval.total_seconds(),
+            "polls_processed": coordinator.polls_processed,
+            "polls_skipped": coordinator.polls_skipped,
+            "breaker": {
+                "state": coordinator.breaker.state,
+                "consecutive_failures": coordinator.breaker.failures,
+                "backoff": coordinator.breaker.backoff,
+            },
+            "probe": coordinator.probe.as_dict() if coordinator.probe else None,
+            "latency": async_redact_data(coordinator.latency.as_dict(), TO_REDACT)
+            if coordinator.latency
+            else None,
+            "timings_ms": coordinator.poll_timings.as_dict(),
+            "endpoints": {
+                path: stats.as_dict()
+                for path, stats in coordinator.endpoint_stats.items()
+            },
+        },
+        "fleet": coordinator.fleet.stats() if coordinator.fleet else None,
+        "data": async_redact_data(_data_to_dict(coordinator.data), TO_REDACT)
+        if coordinator.data
+        else None,
+    }
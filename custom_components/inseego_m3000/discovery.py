@@ -0,0 +1,87 @@
+"""Find Inseego M3000 hotspots on local subnets."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import ipaddress
+import logging
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+    STATUS_PATH,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def device_info_from_status(payload: Any) -> dict[str, str] | None:
+    """Return the network details of a /srv/status response.
+
+    Returns None if the payload is not from an Inseego M3000.
+    """
+    if not isinstance(payload, dict) or not isinstance(
+        status_data := payload.get("statusData"), dict
+    ):
+        return None
+    return {
+        "network": status_data.get("statusBarNetwork", "Unknown"),
+        "technology": status_data.get("statusBarTechnology", "Unknown"),
+    }
+
+
+def hosts_in_subnets(text: str) -> list[str]:
+    """Return the host addresses of comma separated subnets or addresses.
+
+    Raises ValueError if an entry is not an IPv4 subnet (CIDR) or address,
+    or if the subnets hold more than DISCOVERY_MAX_HOSTS hosts.
+    """
+    hosts: dict[str, None] = {}  # ordered and without duplicates
+    for entry in text.replace(",", " ").split():
+        network = ipaddress.IPv4Network(entry, strict=False)
+        if network.num_addresses > DISCOVERY_MAX_HOSTS:
+            raise ValueError(f"{entry} is too large")
+        addresses = network.hosts() if network.num_addresses > 1 else [network[0]]
+        hosts.update((str(address), None) for address in addresses)
+        if len(hosts) > DISCOVERY_MAX_HOSTS:
+            raise ValueError("Too many hosts")
+    if not hosts:
+        raise ValueError("No subnets")
+    return list(hosts)
+
+
+async def async_scan(hosts: Iterable[str]) -> dict[str, dict[str, str]]:
+    """Probe hosts concurrently; return the device info of every M3000 found.
+
+    At most DISCOVERY_CONCURRENCY hosts are probed at once, each with a
+    short connect timeout, so hosts that don't exist (the common case) cost
+    at most DISCOVERY_CONNECT_TIMEOUT and a /24 is scanned in a few seconds.
+    """
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(
+        total=DISCOVERY_TIMEOUT, connect=DISCOVERY_CONNECT_TIMEOUT
+    )
+    found: dict[str, dict[str, str]] = {}
+
+    async def _async_probe(session: aiohttp.ClientSession, host: str) -> None:
+        async with semaphore:
+            try:
+                async with session.get(f"http://{host}{STATUS_PATH}") as response:
+                    if response.status != 200:
+                        return
+                    payload = await response.json(content_type=None)
+            except (aiohttp.ClientError, TimeoutError, ValueError):
+                return
+        if (device_info := device_info_from_status(payload)) is not None:
+            found[host] = device_info
+
+    connector = aiohttp.TCPConnector(limit=DISCOVERY_CONCURRENCY, force_close=True)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await asyncio.gather(*(_async_probe(session, host) for host in hosts))
+    _LOGGER.debug("Discovery found %s", list(found))
+    return found
@@ -0,0 +1,113 @@
+"""Hourly long-term statistics for high-rate Inseego M3000 measurements."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from homeassistant.const import SIGNAL_STRENGTH_DECIBELS, UnitOfDataRate
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .models import InseegoM3000Data
+
+_LOGGER = logging.getLogger(__name__)
+
+# metric: (InseegoM3000Data section, statistic name, unit)
+EXTERNAL_STATISTICS: dict[str, tuple[str, str, str | None]] = {
+    "signal_bars": ("status", "Signal Strength", "bars"),
+    "snr": ("status", "Signal to Noise Ratio", SIGNAL_STRENGTH_DECIBELS),
+    "rx_rate": ("rates", "Download Rate", UnitOfDataRate.BYTES_PER_SECOND),
+    "tx_rate": ("rates", "Upload Rate", UnitOfDataRate.BYTES_PER_SECOND),
+    "total_rate": ("rates", "Total Throughput", UnitOfDataRate.BYTES_PER_SECOND),
+}
+
+
+class _HourAggregate:
+    """Running mean/min/max of one metric for the current hour."""
+
+    __slots__ = ("total", "count", "min", "max")
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.count = 0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+class HourlyStatistics:
+    """Aggregate every poll in memory and import one row per metric per hour.
+
+    The rows are added as external statistics (``inseego_m3000:<host>_<metric>``)
+    so their history does not depend on how often the entity states are
+    written. The hour in progress is not imported, so it is lost when Home
+    Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str) -> None:
+        """Initialize the aggregates."""
+        self.hass = hass
+        self._prefix = f"{DOMAIN}:{slugify(host)}"
+        self._host = host
+        self._hour: datetime | None = None
+        self._aggregates = {
+            metric: _HourAggregate() for metric in EXTERNAL_STATISTICS
+        }
+
+    @callback
+    def add(self, timestamp: datetime, data: InseegoM3000Data) -> None:
+        """Add the measurements of one poll taken at ``timestamp`` (UTC)."""
+        hour = timestamp.replace(minute=0, second=0, microsecond=0)
+        if self._hour is not None and hour != self._hour:
+            self._async_import(self._hour)
+        self._hour = hour
+        for metric, (section, _, _) in EXTERNAL_STATISTICS.items():
+            value = getattr(getattr(data, section), metric)
+            if value is not None:
+                self._aggregates[metric].add(value)
+
+    @callback
+    def _async_import(self, hour: datetime) -> None:
+        """Import the finished hour and start new aggregates."""
+        aggregates, self._aggregates = self._aggregates, {
+            metric: _HourAggregate() for metric in EXTERNAL_STATISTICS
+        }
+        if "recorder" not in self.hass.config.components:
+            return
+        # Imported here so the recorder is only loaded when this mode is used.
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        for metric, aggregate in aggregates.items():
+            if not aggregate.count:
+                continue
+            _, name, unit = EXTERNAL_STATISTICS[metric]
+            async_add_external_statistics(
+                self.hass,
+                {
+                    "has_mean": True,
+                    "has_sum": False,
+                    "name": f"Inseego M3000 ({self._host}) {name}",
+                    "source": DOMAIN,
+                    "statistic_id": f"{self._prefix}_{metric}",
+                    "unit_of_measurement": unit,
+                },
+                [
+                    {
+                        "start": hour,
+                        "mean": aggregate.total / aggregate.count,
+                        "min": aggregate.min,
+                        "max": aggregate.max,
+                    }
+                ],
+            )
+        _LOGGER.debug(
+            "Imported statistics for %s, hour starting %s", self._host, hour
+        )
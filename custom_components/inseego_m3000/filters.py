@@ -0,0 +1,115 @@
+"""State write filters for noisy Inseego M3000 sensors."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class NoiseFilterOptions:
+    """Filter settings from the options flow, shared by a hotspot's entities."""
+
+    min_hold: float  # seconds a published value is kept at least
+    debounce_polls: int  # consecutive polls a binary transition must last
+    max_age: float  # seconds after which a value is published regardless
+    # Band per deadband option: in the sensor's unit, or a fraction of the
+    # published value for relative bands
+    deadbands: dict[str, float] = field(default_factory=dict)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class DeadbandFilter:
+    """Decide whether a new sensor value is worth publishing.
+
+    A numeric value is published when it differs from the last published
+    value by more than the band configured for ``option``: an absolute
+    difference, or with ``relative`` a fraction of the published value.
+    Nothing is published within ``min_hold`` of the last publish, and
+    anything that changed is published once the last publish is ``max_age``
+    old, so a value sitting just inside the band still shows up.
+    """
+
+    __slots__ = ("option", "relative", "_value", "_published_at")
+
+    def __init__(self, option: str, relative: bool = False) -> None:
+        """Initialize the filter."""
+        self.option = option
+        self.relative = relative
+        self._value: Any = None
+        self._published_at: float | None = None
+
+    def accept(self, value: Any, now: float, options: NoiseFilterOptions) -> bool:
+        """Return True if ``value`` should be published at ``now``."""
+        if self._published_at is None:
+            return True
+        if value == self._value:
+            return False
+        age = now - self._published_at
+        if age < options.min_hold:
+            return False
+        if age >= options.max_age:
+            return True
+        if not (_is_number(value) and _is_number(self._value)):
+            return True
+        band = options.deadbands.get(self.option, 0)
+        if self.relative:
+            band *= abs(self._value)
+        return abs(value - self._value) > band
+
+    def retry_in(
+        self, value: Any, now: float, options: NoiseFilterOptions
+    ) -> float | None:
+        """Return the seconds until a rejected ``value`` may be published.
+
+        None if it is the published value, so there is nothing to publish.
+        """
+        if self._published_at is None or value == self._value:
+            return None
+        age = now - self._published_at
+        if age < options.min_hold:
+            return options.min_hold - age
+        return max(options.max_age - age, 0)
+
+    def published(self, value: Any, now: float) -> None:
+        """Record that ``value`` was published at ``now``."""
+        self._value = value
+        self._published_at = now
+
+
+class Debouncer:
+    """Only accept a binary transition after it lasted several polls."""
+
+    __slots__ = ("state", "_candidate", "_count")
+
+    def __init__(self) -> None:
+        """Initialize without a state."""
+        self.state: bool | None = None
+        self._candidate: bool | None = None
+        self._count = 0
+
+    def reset(self) -> None:
+        """Forget the state, e.g. when filtering is turned off."""
+        self.state = None
+        self._candidate = None
+        self._count = 0
+
+    def update(self, value: bool, polls: int) -> bool:
+        """Add the value of one poll and return the debounced state."""
+        if self.state is None or value == self.state:
+            self.state = value
+            self._candidate = None
+            self._count = 0
+            return value
+        if value == self._candidate:
+            self._count += 1
+        else:
+            self._candidate = value
+            self._count = 1
+        if self._count >= polls:
+            self.state = value
+            self._candidate = None
+            self._count = 0
+        return self.state
@@ -0,0 +1,125 @@
+"""Domain-wide poll scheduling for many Inseego M3000 hotspots."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import FLEET_JITTER, FLEET_LATENCY_SAMPLES, FLEET_MAX_CONCURRENT
+from .metrics import percentile
+
+if TYPE_CHECKING:
+    from .coordinator import InseegoM3000DataUpdateCoordinator
+
+# Poll priorities; lower values are granted a slot first.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+
+class InseegoM3000Fleet:
+    """Gate the polls of every configured hotspot.
+
+    Each coordinator still owns its own refresh timer, but the actual device
+    requests run inside a fleet slot. At most ``max_concurrent`` polls are in
+    flight at once; waiting polls are granted in priority order (devices
+    whose last poll failed or changed first) and polls that would otherwise
+    fire in a burst are staggered by a random jitter.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = FLEET_MAX_CONCURRENT,
+        jitter: float = FLEET_JITTER,
+    ) -> None:
+        """Initialize the fleet."""
+        self.coordinators: set[InseegoM3000DataUpdateCoordinator] = set()
+        self._max_concurrent = max_concurrent
+        self._jitter = jitter
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._latencies: deque[float] = deque(maxlen=FLEET_LATENCY_SAMPLES)
+        self._finished_at: deque[float] = deque(maxlen=FLEET_LATENCY_SAMPLES)
+        self.polls = 0
+        self.failures = 0
+
+    def register(self, coordinator: InseegoM3000DataUpdateCoordinator) -> None:
+        """Add a coordinator to the fleet."""
+        self.coordinators.add(coordinator)
+        coordinator.fleet = self
+
+    def unregister(self, coordinator: InseegoM3000DataUpdateCoordinator) -> None:
+        """Remove a coordinator from the fleet."""
+        self.coordinators.discard(coordinator)
+        coordinator.fleet = None
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_NORMAL) -> AsyncIterator[None]:
+        """Hold one of the fleet's concurrent poll slots."""
+        if self._in_flight or self._waiters:
+            # Other polls are running: spread this one out instead of
+            # joining the burst.
+            await asyncio.sleep(random.uniform(0, self._jitter))
+        await self._acquire(priority)
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException:
+            self.failures += 1
+            raise
+        finally:
+            finished = time.monotonic()
+            self.polls += 1
+            self._latencies.append(finished - started)
+            self._finished_at.append(finished)
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait until a slot is free."""
+        if self._in_flight < self._max_concurrent and not self._waiters:
+            self._in_flight += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation.
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Free a slot, handing it to the highest priority waiter."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return fleet-wide poll throughput and latency figures."""
+        latencies = sorted(self._latencies)
+        throughput = None
+        if len(self._finished_at) > 1:
+            span = self._finished_at[-1] - self._finished_at[0]
+            if span > 0:
+                throughput = round((len(self._finished_at) - 1) * 60 / span, 2)
+        return {
+            "devices": len(self.coordinators),
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "polls": self.polls,
+            "failures": self.failures,
+            "polls_per_minute": throughput,
+            "latency_p50": percentile(latencies, 0.5),
+            "latency_p95": percentile(latencies, 0.95),
+            "latency_p99": percentile(latencies, 0.99),
+        }
@@ -0,0 +1,556 @@
+"""Helpers for the runtime metrics kept by the Inseego M3000 integration."""
+from __future__ import annotations
+
+from array import array
+import bisect
+from collections import deque
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+from .models import (
+    LifetimeTotals,
+    StatusSnapshot,
+    ThroughputRates,
+    UsageForecast,
+    UsageSnapshot,
+)
+
+SECONDS_PER_DAY = 86400
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float | None:
+    """Return the nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class ThroughputTracker:
+    """Derive transfer rates from consecutive status byte counters.
+
+    Rates are averaged over the last ``window`` poll intervals (time
+    weighted). Running sums keep each update O(1).
+    """
+
+    def __init__(self, window: int = 1) -> None:
+        """Initialize the tracker."""
+        self._window = max(window, 1)
+        self._last: tuple[float, StatusSnapshot] | None = None
+        # (seconds, rx bytes, tx bytes, total bytes) per poll interval
+        self._intervals: deque[tuple[float, int, int, int]] = deque()
+        self._sums = [0.0, 0, 0, 0]
+
+    def reset(self) -> None:
+        """Forget all samples, e.g. after a counter reset."""
+        self._intervals.clear()
+        self._sums = [0.0, 0, 0, 0]
+
+    def update(self, timestamp: float, status: StatusSnapshot) -> ThroughputRates:
+        """Add a sample taken at ``timestamp`` (time.monotonic) and return the rates."""
+        last = self._last
+        self._last = (timestamp, status)
+        if last is None:
+            return ThroughputRates()
+
+        last_timestamp, last_status = last
+        interval = (
+            timestamp - last_timestamp,
+            status.bytes_received - last_status.bytes_received,
+            status.bytes_transmitted - last_status.bytes_transmitted,
+            status.bytes_total - last_status.bytes_total,
+        )
+        # The modem restarts its counters with every new data session.
+        if (
+            status.connection_duration < last_status.connection_duration
+            or min(interval[1:]) < 0
+        ):
+            self.reset()
+            return ThroughputRates()
+        if interval[0] <= 0:
+            return ThroughputRates()
+
+        self._intervals.append(interval)
+        for index, value in enumerate(interval):
+            self._sums[index] += value
+        if len(self._intervals) > self._window:
+            for index, value in enumerate(self._intervals.popleft()):
+                self._sums[index] -= value
+
+        seconds, rx_bytes, tx_bytes, total_bytes = self._sums
+        return ThroughputRates(
+            rx_rate=rx_bytes / seconds,
+            tx_rate=tx_bytes / seconds,
+            total_rate=total_bytes / seconds,
+        )
+
+
+class LifetimeCounters:
+    """Accumulate the status byte counters across modem counter resets.
+
+    The modem restarts its counters on every reconnect or reboot. A new data
+    session is recognized by its ``connection_duration``, which is kept with
+    the counters: it dropped, or the session started after the last sample
+    was taken (a reconnect while Home Assistant was stopped or the hotspot
+    was backed off, when the new counters may already exceed the old ones).
+    A counter that drops below its last value is a reset as well. On a reset
+    the last value (the high-water mark of the previous session) is added to
+    the counter's offset. Zero readings are ignored: the firmware reports 0
+    while disconnected and when a value can't be parsed, and treating those
+    as resets would count the next real value twice.
+    """
+
+    FIELDS = ("bytes_received", "bytes_transmitted", "bytes_total")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self._offsets = [0, 0, 0]
+        self._last: list[int | None] = [None, None, None]
+        # connection_duration of the last sample and when it was taken
+        self._duration: int | None = None
+        self._seen_at: float | None = None
+
+    def _new_session(self, status: StatusSnapshot, now: float) -> bool:
+        """Return True if the sample belongs to a later data session."""
+        duration = status.connection_duration
+        if duration <= 0 or self._duration is None or self._seen_at is None:
+            return False
+        return duration < self._duration or now - duration > self._seen_at
+
+    def update(self, status: StatusSnapshot, now: float) -> LifetimeTotals:
+        """Add a status sample taken at ``now`` (a Unix timestamp).
+
+        Returns the lifetime totals.
+        """
+        new_session = self._new_session(status, now)
+        for index, field in enumerate(self.FIELDS):
+            value = getattr(status, field)
+            last = self._last[index]
+            if last is not None and (new_session or 0 < value < last):
+                self._offsets[index] += last
+                self._last[index] = None
+            if value > 0:
+                self._last[index] = value
+        if status.connection_duration > 0:
+            self._duration = status.connection_duration
+            self._seen_at = now
+        return self.totals()
+
+    def totals(self) -> LifetimeTotals:
+        """Return the current lifetime totals."""
+        return LifetimeTotals(
+            *(offset + (last or 0) for offset, last in zip(self._offsets, self._last))
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "offsets": list(self._offsets),
+            "last": list(self._last),
+            "duration": self._duration,
+            "seen_at": self._seen_at,
+        }
+
+    def restore(self, stored: dict[str, Any] | None) -> None:
+        """Restore the state saved by as_dict()."""
+        if not stored:
+            return
+        try:
+            offsets = [int(value) for value in stored["offsets"]]
+            last = [None if value is None else int(value) for value in stored["last"]]
+            # Not stored by earlier versions
+            duration = stored.get("duration")
+            seen_at = stored.get("seen_at")
+            duration = None if duration is None else int(duration)
+            seen_at = None if seen_at is None else float(seen_at)
+        except (KeyError, TypeError, ValueError):
+            return
+        if len(offsets) == len(last) == len(self.FIELDS):
+            self._offsets, self._last = offsets, last
+            self._duration, self._seen_at = duration, seen_at
+
+
+def days_until_cycle_end(now: datetime, usage: UsageSnapshot) -> float:
+    """Return the days from ``now`` (aware) until the billing cycle ends.
+
+    The cycle is taken to end at midnight after ``cycle_end`` (MM/DD/YYYY,
+    in the timezone of ``now``); ``days_left`` is used if it can't be parsed.
+    """
+    try:
+        end_date = datetime.strptime(usage.cycle_end, "%m/%d/%Y")
+    except ValueError:
+        return float(max(usage.days_left, 0))
+    end = end_date.replace(tzinfo=now.tzinfo) + timedelta(days=1)
+    return max((end - now).total_seconds() / SECONDS_PER_DAY, 0.0)
+
+
+class UsageForecaster:
+    """Estimate the billing cycle's usage rate and project it to the cycle end.
+
+    Every usage sample (time, line usage) is added to running least squares
+    sums, so a sample costs O(1) and the whole state is a few numbers that
+    are persisted across restarts. The fit starts over when ``cycle_end``
+    changes (a new billing cycle) or the usage drops. No rate is reported
+    until the samples span ``min_span`` seconds.
+    """
+
+    def __init__(self, min_span: float) -> None:
+        """Initialize the estimator."""
+        self._min_span = min_span / SECONDS_PER_DAY
+        self._cycle_end: str | None = None
+        self._origin: float | None = None  # timestamp of the first sample
+        self._last: tuple[float, float] | None = None  # (days, usage)
+        # Sample count and sums of t, u, t² and t·u, t in days since _origin
+        self._sums = [0, 0.0, 0.0, 0.0, 0.0]
+
+    def _reset(self, cycle_end: str) -> None:
+        """Start a new fit for a billing cycle."""
+        self._cycle_end = cycle_end
+        self._origin = None
+        self._last = None
+        self._sums = [0, 0.0, 0.0, 0.0, 0.0]
+
+    def add(self, now: datetime, usage: UsageSnapshot) -> UsageForecast:
+        """Add the usage reported at ``now`` and return the new forecast."""
+        timestamp = now.timestamp()
+        if usage.cycle_end != self._cycle_end or (
+            self._last is not None and usage.line_usage < self._last[1]
+        ):
+            self._reset(usage.cycle_end)
+        if self._origin is None:
+            self._origin = timestamp
+        days = (timestamp - self._origin) / SECONDS_PER_DAY
+        value = usage.line_usage
+        sums = self._sums
+        sums[0] += 1
+        sums[1] += days
+        sums[2] += value
+        sums[3] += days * days
+        sums[4] += days * value
+        self._last = (days, value)
+        return self.project(now, usage)
+
+    def rate(self) -> float | None:
+        """Return the estimated usage rate in GB per day."""
+        count, sum_t, sum_u, sum_tt, sum_tu = self._sums
+        if self._last is None or self._last[0] < self._min_span:
+            return None
+        denominator = count * sum_tt - sum_t * sum_t
+        if denominator <= 0:
+            return None
+        return max((count * sum_tu - sum_t * sum_u) / denominator, 0.0)
+
+    def project(self, now: datetime, usage: UsageSnapshot) -> UsageForecast:
+        """Return the forecast for the usage reported at ``now``."""
+        if (rate := self.rate()) is None:
+            return UsageForecast()
+        exhaustion_days = None
+        if rate > 0 and usage.allowance > 0:
+            exhaustion_days = max(usage.remaining_usage, 0.0) / rate
+        return UsageForecast(
+            usage_rate=rate,
+            projected_usage=usage.line_usage
+            + rate * days_until_cycle_end(now, usage),
+            exhaustion_days=exhaustion_days,
+        )
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the state to persist."""
+        return {
+            "cycle_end": self._cycle_end,
+            "origin": self._origin,
+            "last": list(self._last) if self._last else None,
+            "sums": list(self._sums),
+        }
+
+    def restore(self, stored: dict[str, object] | None) -> None:
+        """Restore the state saved by as_dict()."""
+        if not stored:
+            return
+        try:
+            cycle_end = stored["cycle_end"]
+            origin = None if stored["origin"] is None else float(stored["origin"])
+            last = None if stored["last"] is None else tuple(map(float, stored["last"]))
+            sums = [int(stored["sums"][0]), *map(float, stored["sums"][1:])]
+        except (IndexError, KeyError, TypeError, ValueError):
+            return
+        if len(sums) == 5 and (last is None or len(last) == 2):
+            self._cycle_end, self._origin, self._last = cycle_end, origin, last
+            self._sums = sums
+
+
+class Histogram:
+    """Fixed bucket layout used to estimate percentiles in O(buckets)."""
+
+    def __init__(self, edges: Sequence[float]) -> None:
+        """Initialize with ascending bucket upper edges."""
+        self.edges = tuple(edges)
+
+    def index(self, value: float) -> int:
+        """Return the bucket index of a value (len(edges) if above them)."""
+        return bisect.bisect_left(self.edges, value)
+
+    def value(self, index: int) -> float:
+        """Return the representative (upper edge) value of a bucket."""
+        return self.edges[min(index, len(self.edges) - 1)]
+
+    @classmethod
+    def linear(cls, low: float, high: float, step: float) -> Histogram:
+        """Buckets of equal width between low and high."""
+        count = int(round((high - low) / step)) + 1
+        return cls([low + step * index for index in range(count)])
+
+    @classmethod
+    def exponential(cls, low: float, high: float, factor: float = 1.25) -> Histogram:
+        """Buckets growing by ``factor``, for values spanning decades."""
+        edges = [0.0]
+        edge = low
+        while edge < high:
+            edges.append(edge)
+            edge *= factor
+        edges.append(high)
+        return cls(edges)
+
+
+class RollingWindow:
+    """Min/max/mean/p95 over the samples of the last ``seconds``.
+
+    Samples live in a fixed-size, array-backed ring buffer. Every statistic
+    is maintained incrementally: a running sum for the mean, monotonic
+    deques for min and max and a bucket histogram for the percentile, so
+    adding a sample is O(1) amortized regardless of the window length.
+    """
+
+    def __init__(self, seconds: float, capacity: int, histogram: Histogram) -> None:
+        """Initialize the window."""
+        self.seconds = seconds
+        self._capacity = capacity
+        self._histogram = histogram
+        self._values = array("d", [0.0]) * capacity
+        self._times = array("d", [0.0]) * capacity
+        # One extra bucket for values above the last edge
+        self._counts = array("l", [0]) * (len(histogram.edges) + 1)
+        self._start = 0  # sequence number of the oldest sample
+        self._end = 0  # sequence number of the next sample
+        self._sum = 0.0
+        # (sequence number, value), values increasing / decreasing
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._end - self._start
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample taken at ``timestamp`` (time.monotonic)."""
+        value = float(value)
+        self._expire(timestamp - self.seconds)
+        if len(self) == self._capacity:
+            self._pop()
+
+        sequence = self._end
+        slot = sequence % self._capacity
+        self._values[slot] = value
+        self._times[slot] = timestamp
+        self._end += 1
+        self._sum += value
+        self._counts[self._histogram.index(value)] += 1
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((sequence, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((sequence, value))
+
+    def _expire(self, cutoff: float) -> None:
+        """Drop samples taken at or before ``cutoff``."""
+        while len(self) and self._times[self._start % self._capacity] <= cutoff:
+            self._pop()
+
+    def expires_at(self) -> float | None:
+        """Return when the newest sample leaves the window, None if empty."""
+        if not len(self):
+            return None
+        return self._times[(self._end - 1) % self._capacity] + self.seconds
+
+    def _pop(self) -> None:
+        """Drop the oldest sample."""
+        sequence = self._start
+        value = self._values[sequence % self._capacity]
+        self._start += 1
+        self._sum -= value
+        self._counts[self._histogram.index(value)] -= 1
+        if self._min and self._min[0][0] == sequence:
+            self._min.popleft()
+        if self._max and self._max[0][0] == sequence:
+            self._max.popleft()
+        if not len(self):
+            # Reset the running sum so float error can't accumulate.
+            self._sum = 0.0
+
+    def summary(self, now: float) -> dict[str, float | None]:
+        """Return min/max/mean/p95 of the samples still inside the window."""
+        self._expire(now - self.seconds)
+        count = len(self)
+        if not count:
+            return {"min": None, "max": None, "mean": None, "p95": None, "samples": 0}
+
+        rank = max(math.ceil(0.95 * count), 1)
+        seen = 0
+        p95 = None
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                p95 = self._histogram.value(index)
+                break
+        return {
+            "min": self._min[0][1],
+            "max": self._max[0][1],
+            "mean": self._sum / count,
+            "p95": min(p95, self._max[0][1]),
+            "samples": count,
+        }
+
+
+class RollingStatistics:
+    """Rolling windows of several lengths over one metric."""
+
+    def __init__(
+        self,
+        windows: dict[str, int],
+        histogram: Histogram,
+        min_sample_interval: float,
+    ) -> None:
+        """Initialize one RollingWindow per named window length."""
+        self.windows = {
+            name: RollingWindow(
+                seconds,
+                math.ceil(seconds / min_sample_interval) + 1,
+                histogram,
+            )
+            for name, seconds in windows.items()
+        }
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample to every window."""
+        for window in self.windows.values():
+            window.add(timestamp, value)
+
+    def summary(self, window: str, now: float) -> dict[str, float | None]:
+        """Return the statistics of one window."""
+        return self.windows[window].summary(now)
+
+
+class PhaseTimings:
+    """Keep the most recent durations of named phases, in seconds."""
+
+    def __init__(self, samples: int) -> None:
+        """Initialize with the number of samples kept per phase."""
+        self._maxlen = samples
+        self._phases: dict[str, deque[float]] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Add a duration for a phase."""
+        if (durations := self._phases.get(phase)) is None:
+            durations = self._phases[phase] = deque(maxlen=self._maxlen)
+        durations.append(seconds)
+
+    def summary(self, phase: str) -> dict[str, float | None]:
+        """Return the last value and percentiles of a phase in milliseconds."""
+        durations = self._phases.get(phase, ())
+        ordered = sorted(durations)
+        values = {
+            "last": durations[-1] if durations else None,
+            "p50": percentile(ordered, 0.5),
+            "p95": percentile(ordered, 0.95),
+            "p99": percentile(ordered, 0.99),
+        }
+        return {
+            name: None if value is None else round(value * 1000, 2)
+            for name, value in values.items()
+        }
+
+    def as_dict(self) -> dict[str, dict[str, float | None]]:
+        """Return the summaries of every recorded phase."""
+        return {phase: self.summary(phase) for phase in self._phases}
+
+
+class LatencyWindow:
+    """Round-trip times of the most recent probes to one or more targets.
+
+    Each sample is a (target, seconds) pair, or (target, None) for a probe
+    that got no reply. Jitter is the mean difference between consecutive
+    replies from the same target, so mixing near and far targets doesn't
+    show up as jitter.
+    """
+
+    def __init__(self, samples: int) -> None:
+        """Initialize with the number of samples kept."""
+        self._samples: deque[tuple[str, float | None]] = deque(maxlen=samples)
+
+    def add(self, target: str, rtt: float | None) -> None:
+        """Add the result of one probe."""
+        self._samples.append((target, rtt))
+
+    def summary(self) -> dict[str, float | None]:
+        """Return latency, jitter (ms) and loss (%) over the window."""
+        rtts: list[float] = []
+        differences: list[float] = []
+        last: dict[str, float] = {}
+        for target, rtt in self._samples:
+            if rtt is None:
+                continue
+            rtts.append(rtt)
+            if (previous := last.get(target)) is not None:
+                differences.append(abs(rtt - previous))
+            last[target] = rtt
+        rtts.sort()
+        count = len(self._samples)
+        values = {
+            "latency": percentile(rtts, 0.5),
+            "p95": percentile(rtts, 0.95),
+            "jitter": sum(differences) / len(differences) if differences else None,
+        }
+        summary: dict[str, float | None] = {
+            name: None if value is None else round(value * 1000, 2)
+            for name, value in values.items()
+        }
+        summary["loss"] = (
+            round(100 * (count - len(rtts)) / count, 1) if count else None
+        )
+        summary["samples"] = count
+        return summary
+
+
+class EndpointStats:
+    """Request counters and phase timings for one device endpoint.
+
+    Phases are ``connect`` (only when a new connection was opened),
+    ``ttfb`` (request sent until the response headers arrived, including
+    connect), ``download`` (reading the body), ``decode`` (JSON decoding and
+    parsing into a snapshot) and ``request`` (the whole fetch).
+    """
+
+    def __init__(self, samples: int) -> None:
+        """Initialize the counters."""
+        self.timings = PhaseTimings(samples)
+        self.successes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.not_modified = 0
+        self.last_payload_size: int | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the counters and timings for diagnostics."""
+        return {
+            "successes": self.successes,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "not_modified": self.not_modified,
+            "last_payload_size": self.last_payload_size,
+            "last_parse_time_ms": self.timings.summary("decode")["last"],
+            "timings_ms": self.timings.as_dict(),
+        }
@@ -0,0 +1,371 @@
+"""Typed snapshots of the Inseego M3000 API responses."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+def _to_int(value: Any) -> int:
+    """Convert an API value to int, falling back to 0."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _to_float(value: Any) -> float:
+    """Convert an API value to float, falling back to 0.0."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _to_str(value: Any) -> str:
+    """Convert an API value to str, falling back to "Unknown"."""
+    if value is None:
+        return "Unknown"
+    return str(value)
+
+
+def _to_stripped_str(value: Any) -> str:
+    """Convert an API value to a whitespace-stripped str."""
+    return _to_str(value).strip()
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a 0/1 style API flag to bool."""
+    return bool(value)
+
+
+def _to_true_string(value: Any) -> bool:
+    """Convert a "true"/"false" string to bool."""
+    return str(value).lower() == "true"
+
+
+@dataclass(slots=True)
+class StatusSnapshot:
+    """The subset of /srv/status statusData used by the integration."""
+
+    signal_bars: int
+    snr: int
+    battery_percent: int
+    battery_charging: bool
+    battery_present: bool
+    bytes_received: int
+    bytes_transmitted: int
+    bytes_total: int
+    connection_duration: int
+    connection_state: str
+    clients: int
+    wifi_clients: int
+    primary_clients: int
+    network: str
+    network_id: str
+    carrier: str
+    technology: str
+    band: str
+    bandwidth: str
+    pci: str
+    ip_address: str
+    ipv6_address: str
+    gateway: str
+    subnet_mask: str
+    sim_status: str
+    gps_status: str
+    wifi_enabled: bool
+    guest_wifi_enabled: bool
+    mobile_data_enabled: bool
+    ethernet_connected: bool
+    airplane_mode: bool
+    sw_version: str
+
+
+@dataclass(slots=True)
+class UsageSnapshot:
+    """The subset of /apps_home/usageinfo used by the integration."""
+
+    line_usage: float
+    allowance: float
+    remaining_usage: float
+    percentage_remaining: int
+    days_left: int
+    cycle_end: str
+    rx_usage: float
+    tx_usage: float
+
+
+@dataclass(slots=True)
+class ClientSnapshot:
+    """One entry of the connected client list."""
+
+    mac_address: str
+    name: str
+    ip_address: str
+    connection_type: str
+
+
+@dataclass(slots=True)
+class ThroughputRates:
+    """Transfer rates derived from the status byte counters, in bytes/s.
+
+    A rate is None until two comparable samples are available, e.g. right
+    after startup or a counter reset.
+    """
+
+    rx_rate: float | None = None
+    tx_rate: float | None = None
+    total_rate: float | None = None
+
+
+@dataclass(slots=True)
+class LifetimeTotals:
+    """Status byte counters accumulated across modem counter resets."""
+
+    lifetime_received: int = 0
+    lifetime_transmitted: int = 0
+    lifetime_total: int = 0
+
+
+@dataclass(slots=True)
+class UsageForecast:
+    """Billing cycle projection from the usage rate estimated this cycle.
+
+    Fields are None until enough usage samples have been collected.
+    """
+
+    usage_rate: float | None = None  # GB per day
+    projected_usage: float | None = None  # GB at the end of the cycle
+    exhaustion_days: float | None = None  # days until the allowance is used up
+
+
+@dataclass(slots=True)
+class InseegoM3000Data:
+    """Coordinator data: the latest status and usage snapshots."""
+
+    status: StatusSnapshot
+    usage: UsageSnapshot
+    rates: ThroughputRates
+    lifetime: LifetimeTotals
+    forecast: UsageForecast
+    # Connected clients by MAC address; only refetched when a client count
+    # in the status changes.
+    clients: dict[str, ClientSnapshot]
+
+
+# (snapshot attribute, API key, converter)
+STATUS_FIELDS: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("signal_bars", "statusBarSignalBars", _to_int),
+    ("snr", "statusBarSNR", _to_int),
+    ("battery_percent", "statusBarBatteryPercent", _to_int),
+    ("battery_charging", "statusBarBatteryChargingState", _to_true_string),
+    ("battery_present", "statusBarBatteryDetection", lambda v: v == "Present"),
+    ("bytes_received", "statusBarBytesReceived", _to_int),
+    ("bytes_transmitted", "statusBarBytesTransmitted", _to_int),
+    ("bytes_total", "statusBarBytesTotal", _to_int),
+    ("connection_duration", "statusBarConnectionDuration", _to_int),
+    ("connection_state", "statusBarConnectionState", _to_str),
+    ("clients", "statusBarClientListSize", _to_int),
+    ("wifi_clients", "statusBarWiFiClientListSize", _to_int),
+    ("primary_clients", "statusBarPrimaryClientListSize", _to_int),
+    ("network", "statusBarNetwork", _to_str),
+    ("network_id", "statusBarNetworkID", _to_str),
+    ("carrier", "statusBarCarrier", _to_str),
+    ("technology", "statusBarTechnology", _to_str),
+    ("band", "statusBarBand", _to_stripped_str),
+    ("bandwidth", "statusBarBandwidth", _to_stripped_str),
+    ("pci", "statusBarPCI", _to_str),
+    ("ip_address", "internetStatusIPAddress", _to_str),
+    ("ipv6_address", "internetStatusIPv6Address", _to_str),
+    ("gateway", "internetStatusGateway", _to_str),
+    ("subnet_mask", "internetStatusSubnetMask", _to_str),
+    ("sim_status", "statusBarSimStatus", _to_str),
+    ("gps_status", "statusBarGpsStatus", _to_str),
+    ("wifi_enabled", "statusBarWiFiEnabled", _to_bool),
+    ("guest_wifi_enabled", "statusBarGuestWifiEnabled", _to_bool),
+    ("mobile_data_enabled", "statusBarMobileDataEnabled", _to_bool),
+    ("ethernet_connected", "statusBarEthernetPortEnabled", lambda v: v == "connected"),
+    ("airplane_mode", "statusBarAirplaneMode", lambda v: v != "AirplaneModeOff"),
+    ("sw_version", "StatusBarSoftwareUpdateSourceVersion", _to_str),
+)
+
+USAGE_FIELDS: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("line_usage", "lineUsage", _to_float),
+    ("allowance", "allowance", _to_float),
+    ("remaining_usage", "remainingUsage", _to_float),
+    ("percentage_remaining", "barPercentageRemaining", _to_int),
+    ("days_left", "daysLeft", _to_int),
+    ("cycle_end", "cycleEndDt", lambda v: _to_str(v).replace("&#x2F;", "/")),
+    ("rx_usage", "rxUsage", _to_float),
+    ("tx_usage", "txUsage", _to_float),
+)
+
+# Keys of one entry of the connected client list (CLIENTS_PATH)
+CLIENT_FIELDS: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("mac_address", "macAddress", lambda v: _to_str(v).lower()),
+    ("name", "hostName", _to_stripped_str),
+    ("ip_address", "ipAddress", _to_str),
+    ("connection_type", "connectionType", _to_str),
+)
+
+# Status fields whose change triggers a client list refresh
+CLIENT_COUNT_FIELDS = ("clients", "wifi_clients", "primary_clients")
+
+# Changed-field key of the client list as a whole (any join, leave or change)
+CLIENTS_KEY = "clients_list"
+
+
+def client_key(mac_address: str) -> str:
+    """Return the changed-field key of one client."""
+    return f"client:{mac_address}"
+
+
+# ThroughputRates/LifetimeTotals/UsageForecast fields and the snapshot field
+# each one is derived from
+DERIVED_SOURCES: dict[str, str] = {
+    "rx_rate": "bytes_received",
+    "tx_rate": "bytes_transmitted",
+    "total_rate": "bytes_total",
+    "lifetime_received": "bytes_received",
+    "lifetime_transmitted": "bytes_transmitted",
+    "lifetime_total": "bytes_total",
+    "usage_rate": "line_usage",
+    "projected_usage": "line_usage",
+    "exhaustion_days": "remaining_usage",
+}
+
+
+# (InseegoM3000Data attribute, snapshot fields) compared between polls
+_SECTIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("status", tuple(attr for attr, _, _ in STATUS_FIELDS)),
+    ("usage", tuple(attr for attr, _, _ in USAGE_FIELDS)),
+    ("rates", ThroughputRates.__slots__),
+    ("lifetime", LifetimeTotals.__slots__),
+    ("forecast", UsageForecast.__slots__),
+)
+
+
+def changed_fields(old: InseegoM3000Data, new: InseegoM3000Data) -> frozenset[str]:
+    """Return the names of the snapshot fields that differ between two polls."""
+    changed: list[str] = []
+    for section, attrs in _SECTIONS:
+        old_section = getattr(old, section)
+        new_section = getattr(new, section)
+        if old_section is new_section:
+            continue
+        changed.extend(
+            attr
+            for attr in attrs
+            if getattr(old_section, attr) != getattr(new_section, attr)
+        )
+    if old.clients is not new.clients:
+        changed.extend(changed_clients(old.clients, new.clients))
+    return frozenset(changed)
+
+
+def changed_clients(
+    old: dict[str, ClientSnapshot], new: dict[str, ClientSnapshot]
+) -> list[str]:
+    """Return the keys of the clients that joined, left or changed.
+
+    CLIENTS_KEY is included if anything changed, so a listener can follow
+    the whole list without subscribing to every client.
+    """
+    changed = [client_key(mac) for mac in old.keys() ^ new.keys()]
+    changed.extend(
+        client_key(mac)
+        for mac in old.keys() & new.keys()
+        if old[mac] != new[mac]
+    )
+    if changed:
+        changed.append(CLIENTS_KEY)
+    return changed
+
+
+def reported_status_fields(payload: dict) -> frozenset[str]:
+    """Return the StatusSnapshot (and derived) fields a response contains.
+
+    Fields whose key is missing are still filled with a converter default by
+    parse_status(); this tells them apart from real values.
+    """
+    raw = payload["statusData"]
+    fields = {attr for attr, key, _ in STATUS_FIELDS if key in raw}
+    fields.update(
+        derived for derived, source in DERIVED_SOURCES.items() if source in fields
+    )
+    return frozenset(fields)
+
+
+def reported_usage_fields(payload: dict) -> frozenset[str]:
+    """Return the UsageSnapshot (and derived) fields a response contains."""
+    fields = {attr for attr, key, _ in USAGE_FIELDS if key in payload}
+    fields.update(
+        derived for derived, source in DERIVED_SOURCES.items() if source in fields
+    )
+    return frozenset(fields)
+
+
+def parse_status(payload: dict) -> StatusSnapshot:
+    """Parse a /srv/status response into a StatusSnapshot.
+
+    Only the keys listed in STATUS_FIELDS are read; the rest of the payload is
+    dropped so it is not kept alive in coordinator.data.
+    """
+    raw = payload["statusData"]
+    return StatusSnapshot(
+        **{attr: convert(raw.get(key)) for attr, key, convert in STATUS_FIELDS}
+    )
+
+
+def parse_usage(payload: dict) -> UsageSnapshot:
+    """Parse a /apps_home/usageinfo response into a UsageSnapshot."""
+    return UsageSnapshot(
+        **{attr: convert(payload.get(key)) for attr, key, convert in USAGE_FIELDS}
+    )
+
+
+def parse_clients(payload: dict) -> dict[str, ClientSnapshot]:
+    """Parse a connected client list response, keyed by MAC address.
+
+    Entries without a MAC address can't be tracked and are dropped.
+    """
+    clients = {}
+    for raw in payload["connectedDevices"]:
+        if not isinstance(raw, dict) or not raw.get("macAddress"):
+            continue
+        client = ClientSnapshot(
+            **{attr: convert(raw.get(key)) for attr, key, convert in CLIENT_FIELDS}
+        )
+        clients[client.mac_address] = client
+    return clients
+
+
+def data_to_dict(data: InseegoM3000Data) -> dict[str, dict[str, Any]]:
+    """Serialize the status and usage snapshots for storage.
+
+    Rates are not stored; they need two live samples anyway. Lifetime totals
+    and the usage forecast are stored by their LifetimeCounters and
+    UsageForecaster. The client list is fetched again
+    by the first poll.
+    """
+    return {"status": asdict(data.status), "usage": asdict(data.usage)}
+
+
+def data_from_dict(stored: dict[str, Any]) -> InseegoM3000Data | None:
+    """Rebuild coordinator data from data_to_dict() output.
+
+    Returns None if the stored snapshots don't match the current fields,
+    e.g. after an upgrade added a field.
+    """
+    try:
+        return InseegoM3000Data(
+            status=StatusSnapshot(**stored["status"]),
+            usage=UsageSnapshot(**stored["usage"]),
+            rates=ThroughputRates(),
+            lifetime=LifetimeTotals(),
+            forecast=UsageForecast(),
+            clients={},
+        )
+    except (KeyError, TypeError):
+        return None
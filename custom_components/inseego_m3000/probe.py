@@ -0,0 +1,404 @@
+"""Probes that run between the full polls of an Inseego M3000 hotspot."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+import os
+import socket
+import time
+from typing import TYPE_CHECKING, Any
+
+import ifaddr
+from yarl import URL
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DEFAULT_LATENCY_PORT,
+    DEFAULT_PORT,
+    LATENCY_SAMPLES,
+    LATENCY_TIMEOUT,
+    PROBE_TIMEOUT,
+)
+from .metrics import LatencyWindow
+
+if TYPE_CHECKING:
+    from .coordinator import InseegoM3000DataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _IntervalProbe:
+    """Run ``_async_probe`` every ``interval`` seconds until stopped."""
+
+    def __init__(self, hass: HomeAssistant, name: str, interval: float) -> None:
+        """Initialize the probe."""
+        self.hass = hass
+        self.name = name
+        self.interval = interval
+        self._running = False
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start probing."""
+        self._unsub = async_track_time_interval(
+            self.hass,
+            self._async_run,
+            timedelta(seconds=self.interval),
+            name=self.name,
+            cancel_on_shutdown=True,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop probing."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    async def _async_run(self, now: datetime | None = None) -> None:
+        """Run one probe unless the previous one is still in progress."""
+        if self._running:
+            return
+        self._running = True
+        try:
+            await self._async_probe()
+        finally:
+            self._running = False
+
+    async def _async_probe(self) -> None:
+        """Probe once."""
+        raise NotImplementedError
+
+
+def parse_targets(text: str) -> list[tuple[str, int]]:
+    """Parse a comma separated list of ``host``, ``host:port`` or ``[v6]:port``.
+
+    Raises ValueError if the list is empty or an entry is malformed.
+    """
+    targets = []
+    for entry in text.replace(",", " ").split():
+        host, port = entry, str(DEFAULT_LATENCY_PORT)
+        if entry.startswith("["):
+            host, bracket, rest = entry[1:].partition("]")
+            if not bracket or (rest and not rest.startswith(":")):
+                raise ValueError(f"Invalid target: {entry}")
+            port = rest[1:] or port
+        elif entry.count(":") == 1:
+            host, port = entry.split(":")
+        if not host or not port.isdigit() or not 0 < int(port) < 65536:
+            raise ValueError(f"Invalid target: {entry}")
+        targets.append((host, int(port)))
+    if not targets:
+        raise ValueError("No targets")
+    return targets
+
+
+# Header of a recursive DNS query with one question, and that question: the
+# NS records of the root zone, which every resolver can answer from cache.
+_QUERY_HEADER = bytes.fromhex("0100 0001 0000 0000 0000")
+_QUERY_QUESTION = bytes.fromhex("00 0002 0001")
+
+
+# Linux only: restricts a socket to one network interface (needs CAP_NET_RAW)
+_SO_BINDTODEVICE: int | None = getattr(socket, "SO_BINDTODEVICE", None)
+
+
+def _interface_of(address: str) -> str | None:
+    """Return the name of the network interface holding an IPv4 address."""
+    for adapter in ifaddr.get_adapters():
+        if any(ip.ip == address for ip in adapter.ips):
+            return adapter.name
+    return None
+
+
+class _ReplyProtocol(asyncio.DatagramProtocol):
+    """Resolve a future with the arrival time of the reply to one query."""
+
+    def __init__(self, query_id: bytes) -> None:
+        self.reply: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        self._query_id = query_id
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        if data[:2] == self._query_id and not self.reply.done():
+            self.reply.set_result(time.perf_counter())
+
+    def error_received(self, exc: Exception) -> None:
+        if not self.reply.done():
+            self.reply.set_exception(exc)
+
+
+class _RoutedProbe(_IntervalProbe):
+    """Send DNS queries to targets through the hotspot at ``via``.
+
+    So that each hotspot's own link is used rather than Home Assistant's
+    default route, queries to IPv4 targets are sent from this host's address
+    on the hotspot's network and, on Linux, bound to that network's
+    interface (which needs CAP_NET_RAW; without it only the source address
+    is set and the routing table decides). Hotspots sharing one interface
+    therefore still share one path.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        interval: float,
+        targets: list[tuple[str, int]],
+        via: str | None = None,
+    ) -> None:
+        """Initialize the probe."""
+        super().__init__(hass, name, interval)
+        self.targets = targets
+        self._via = URL(f"http://{via}").host if via else None
+        # (local address, interface) of this host on the hotspot's network
+        self.route: tuple[str, str | None] | None = None
+        self._bind_interface = _SO_BINDTODEVICE is not None
+
+    async def _async_update_route(self) -> None:
+        """Find this host's address and interface on the hotspot's network."""
+        loop = asyncio.get_running_loop()
+        try:
+            # Connecting a UDP socket sends nothing but picks the source
+            # address of the route to the hotspot.
+            transport, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol,
+                remote_addr=(self._via, DEFAULT_PORT),
+                family=socket.AF_INET,
+            )
+        except OSError as err:
+            _LOGGER.debug("No route to %s for probes: %s", self._via, err)
+            self.route = None
+            return
+        local_address = transport.get_extra_info("sockname")[0]
+        transport.close()
+        if self.route is None or self.route[0] != local_address:
+            interface = await self.hass.async_add_executor_job(
+                _interface_of, local_address
+            )
+            self.route = (local_address, interface)
+
+    async def _async_socket(self, host: str, port: int) -> socket.socket:
+        """Return a UDP socket connected to a target through the hotspot."""
+        loop = asyncio.get_running_loop()
+        family, _, proto, _, address = (
+            await loop.getaddrinfo(host, port, type=socket.SOCK_DGRAM)
+        )[0]
+        sock = socket.socket(family, socket.SOCK_DGRAM, proto)
+        try:
+            sock.setblocking(False)
+            if family == socket.AF_INET and self.route is not None:
+                local_address, interface = self.route
+                if interface is not None and self._bind_interface:
+                    try:
+                        sock.setsockopt(
+                            socket.SOL_SOCKET, _SO_BINDTODEVICE, interface.encode()
+                        )
+                    except PermissionError as err:
+                        _LOGGER.warning(
+                            "Cannot bind probes to %s (%s); they follow the"
+                            " routing table",
+                            interface,
+                            err,
+                        )
+                        self._bind_interface = False
+                sock.bind((local_address, 0))
+            sock.connect(address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    async def _async_rtt(self, host: str, port: int) -> float | None:
+        """Return the round-trip time to a target, or None if it was lost."""
+        query_id = os.urandom(2)
+        loop = asyncio.get_running_loop()
+        try:
+            transport, protocol = await loop.create_datagram_endpoint(
+                lambda: _ReplyProtocol(query_id),
+                sock=await self._async_socket(host, port),
+            )
+        except OSError as err:
+            _LOGGER.debug("Cannot probe %s:%s: %s", host, port, err)
+            return None
+        try:
+            sent = time.perf_counter()
+            transport.sendto(query_id + _QUERY_HEADER + _QUERY_QUESTION)
+            async with asyncio.timeout(LATENCY_TIMEOUT):
+                return await protocol.reply - sent
+        except (OSError, TimeoutError):
+            return None
+        finally:
+            transport.close()
+
+
+class ConnectivityProbe(_RoutedProbe):
+    """Watch whether the hotspot and its WAN link answer between full polls.
+
+    Every ``interval`` seconds a TCP connection to the hotspot's web server
+    is opened and closed again without sending a request, so no endpoint is
+    polled faster and the connection pool of the full polls is not used.
+    While the hotspot answers, one DNS query datagram is also sent through
+    it to each target, like the latency prober does; the WAN link is up if
+    any of them replies. A full coordinator refresh, which waits for a fleet
+    slot like any poll, is requested only when a result changes: the
+    hotspot stopped or started answering, or its WAN link went down or came
+    back. Both thus show up within seconds.
+
+    Probes are paused while the circuit breaker is backing off, so an
+    unreachable device is still only retried at the breaker's pace.
+    """
+
+    def __init__(
+        self,
+        coordinator: InseegoM3000DataUpdateCoordinator,
+        interval: float,
+        targets: list[tuple[str, int]],
+    ) -> None:
+        """Initialize the probe."""
+        super().__init__(
+            coordinator.hass,
+            f"Inseego M3000 probe {coordinator.host}",
+            interval,
+            targets,
+            via=coordinator.host,
+        )
+        self.coordinator = coordinator
+        url = URL(f"http://{coordinator.host}")
+        self._address = (url.host, url.port)
+        # Results of the last probe; None until the first one
+        self._reachable: bool | None = None
+        self._wan: bool | None = None
+        self.probes = 0
+        self.failures = 0
+        self.wan_failures = 0
+        self.refreshes = 0
+
+    async def _async_reachable(self) -> bool:
+        """Return True if the hotspot accepts a TCP connection."""
+        try:
+            async with asyncio.timeout(PROBE_TIMEOUT):
+                _, writer = await asyncio.open_connection(*self._address)
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        return True
+
+    async def _async_wan(self) -> bool | None:
+        """Return True if a target answers through the hotspot.
+
+        None if there are no targets or no route to the hotspot, as the
+        queries would then not go through it.
+        """
+        if not self.targets:
+            return None
+        await self._async_update_route()
+        if self.route is None:
+            return None
+        results = await asyncio.gather(
+            *(self._async_rtt(host, port) for host, port in self.targets)
+        )
+        return any(rtt is not None for rtt in results)
+
+    async def _async_probe(self) -> None:
+        """Probe the device and refresh the coordinator if that changed."""
+        coordinator = self.coordinator
+        if coordinator.data is None or not coordinator.breaker.closed:
+            return
+        reachable = await self._async_reachable()
+        wan = await self._async_wan() if reachable else None
+        self.probes += 1
+        if not reachable:
+            self.failures += 1
+        elif wan is False:
+            self.wan_failures += 1
+        if self._reachable is None:
+            self._reachable = coordinator.last_update_success
+            self._wan = coordinator.data.status.connection_state == "Connected"
+        changed = reachable != self._reachable or (
+            wan is not None and wan != self._wan
+        )
+        self._reachable = reachable
+        if wan is not None:
+            self._wan = wan
+        if not changed:
+            return
+        _LOGGER.debug(
+            "Probe of %s found it %s, refreshing",
+            coordinator.host,
+            "unreachable"
+            if not reachable
+            else f"reachable with the WAN {'up' if self._wan else 'down'}",
+        )
+        self.refreshes += 1
+        await coordinator.async_request_refresh()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the probe counters for diagnostics."""
+        return {
+            "interval": self.interval,
+            "targets": [f"{host}:{port}" for host, port in self.targets],
+            "probes": self.probes,
+            "failures": self.failures,
+            "wan_failures": self.wan_failures,
+            "refreshes": self.refreshes,
+        }
+
+
+class LatencyProber(_RoutedProbe):
+    """Measure round-trip time, jitter and loss to hosts behind the hotspot.
+
+    Every ``interval`` seconds one small DNS query datagram is sent to each
+    target and the time until its reply arrives is recorded; a query without
+    a reply within LATENCY_TIMEOUT counts as lost. The targets are normally
+    public resolvers, but any UDP echo service works as a stand-in. This
+    needs no raw sockets, unlike ICMP ping, and is independent of the status
+    polls.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        targets: list[tuple[str, int]],
+        interval: float,
+        update_callback: Callable[[], None],
+        via: str | None = None,
+    ) -> None:
+        """Initialize the prober."""
+        super().__init__(hass, name, interval, targets, via)
+        self.window = LatencyWindow(LATENCY_SAMPLES)
+        self.summary = self.window.summary()
+        self._update_callback = update_callback
+
+    @callback
+    def async_start(self) -> None:
+        """Start probing, with a first round right away."""
+        super().async_start()
+        self.hass.async_create_background_task(self._async_run(), self.name)
+
+    async def _async_probe(self) -> None:
+        """Probe every target once and publish the new summary."""
+        if self._via is not None:
+            await self._async_update_route()
+        results = await asyncio.gather(
+            *(self._async_rtt(host, port) for host, port in self.targets)
+        )
+        for (host, port), rtt in zip(self.targets, results):
+            self.window.add(f"{host}:{port}", rtt)
+        self.summary = self.window.summary()
+        self._update_callback()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the targets and latest summary for diagnostics."""
+        return {
+            "interval": self.interval,
+            "targets": [f"{host}:{port}" for host, port in self.targets],
+            "source_address": self.route[0] if self.route else None,
+            "interface": self.route[1] if self.route else None,
+            **self.summary,
+        }
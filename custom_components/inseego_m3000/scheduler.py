@@ -0,0 +1,116 @@
+"""Polling policies for the Inseego M3000 coordinator."""
+from __future__ import annotations
+
+import random
+
+from .models import StatusSnapshot
+
+# Snapshot fields whose change means something interesting is happening and
+# the device should be polled at the fastest configured rate again.
+TRIGGER_KEYS = frozenset(
+    {"connection_state", "signal_bars", "clients", "wifi_clients", "primary_clients"}
+)
+
+# Number of consecutive unchanged polls before the interval is doubled.
+STABLE_POLLS_PER_STEP = 3
+
+# Upper bound on how many times the interval can be doubled.
+MAX_DOUBLINGS = 8
+
+# Extra slowdown factor while the hotspot runs on battery.
+BATTERY_FACTOR = 2
+
+# Circuit breaker states
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class AdaptivePollingPolicy:
+    """Pick the next status poll interval from the recent poll history.
+
+    The interval starts at ``min_interval`` and doubles after every
+    ``STABLE_POLLS_PER_STEP`` consecutive polls without a change in
+    ``TRIGGER_KEYS``, up to ``max_interval``. Polling is also slowed down
+    while the device is discharging. Any trigger change resets it to
+    ``min_interval``.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        """Initialize the policy."""
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self._stable_polls = 0
+
+    def next_interval(
+        self, changed_keys: frozenset[str] | None, status: StatusSnapshot
+    ) -> float:
+        """Return the number of seconds until the next poll.
+
+        ``changed_keys`` is None when the change set is unknown (first poll or
+        recovery), which is treated like a trigger change.
+        """
+        if changed_keys is None or not TRIGGER_KEYS.isdisjoint(changed_keys):
+            self._stable_polls = 0
+        else:
+            # Capped so the exponent stays small on long-idle devices.
+            self._stable_polls = min(
+                self._stable_polls + 1, STABLE_POLLS_PER_STEP * MAX_DOUBLINGS
+            )
+
+        interval = self.min_interval * 2 ** (self._stable_polls // STABLE_POLLS_PER_STEP)
+        if status.battery_present and not status.battery_charging:
+            interval *= BATTERY_FACTOR
+        return min(interval, self.max_interval)
+
+
+class CircuitBreaker:
+    """Back off from a device that keeps failing.
+
+    After ``threshold`` consecutive failed polls the breaker opens and the
+    next poll is delayed by an exponentially growing backoff (starting at
+    ``base_delay`` and capped at ``max_delay``) with random jitter, so a
+    fleet of powered-off hotspots does not retry in lockstep. The poll that
+    fires after the backoff is a half-open probe; a success closes the
+    breaker and polling returns to its normal cadence immediately.
+    """
+
+    def __init__(self, base_delay: float, max_delay: float, threshold: int) -> None:
+        """Initialize a closed breaker."""
+        self.base_delay = base_delay
+        self.max_delay = max(base_delay, max_delay)
+        self.threshold = threshold
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.backoff: float | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Return True while the device is polled normally."""
+        return self.state == BREAKER_CLOSED
+
+    def before_poll(self) -> None:
+        """Mark the poll about to run as a probe if the breaker is open."""
+        if self.state == BREAKER_OPEN:
+            self.state = BREAKER_HALF_OPEN
+
+    def record_success(self) -> bool:
+        """Reset after a successful poll; return True if the breaker closed."""
+        was_closed = self.closed
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.backoff = None
+        return not was_closed
+
+    def record_failure(self) -> float | None:
+        """Count a failed poll; return the backoff delay if the breaker is open."""
+        # Capped so the exponent stays small for devices that are off for good.
+        self.failures = min(self.failures + 1, self.threshold + MAX_DOUBLINGS)
+        if self.failures < self.threshold:
+            return None
+        delay = min(
+            self.base_delay * 2 ** (self.failures - self.threshold), self.max_delay
+        )
+        self.state = BREAKER_OPEN
+        self.backoff = random.uniform(delay / 2, delay)
+        return self.backoff
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -21,145 +22,103 @@ from homeassistant.const import (
     UnitOfInformation,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_RATE_DEADBAND,
+    CONF_SIGNAL_DEADBAND,
+    CONF_SNR_DEADBAND,
+    DOMAIN,
+    STATISTICS_STATE_INTERVAL,
+    STATISTICS_WINDOWS,
+    STATUS_PATH,
+    USAGE_PATH,
+)
 from .coordinator import InseegoM3000DataUpdateCoordinator
+from .filters import DeadbandFilter
+from .models import InseegoM3000Data
+from .scheduler import BREAKER_CLOSED, BREAKER_HALF_OPEN, BREAKER_OPEN
 
 
 @dataclass
 class InseegoSensorEntityDescription(SensorEntityDescription):
     """Describes Inseego sensor entity."""
 
-    value_fn: Callable[[dict], StateType] = None
-    attributes_fn: Callable[[dict], dict] = None
-
-
-def get_signal_bars(data: dict) -> int:
-    """Extract signal bars."""
-    status_data = data.get("statusData", {})
-    bars = status_data.get("statusBarSignalBars", "0")
-    try:
-        return int(bars)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_battery_percent(data: dict) -> int:
-    """Extract battery percentage."""
-    status_data = data.get("statusData", {})
-    percent = status_data.get("statusBarBatteryPercent", "0")
-    try:
-        return int(percent)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_snr(data: dict) -> int:
-    """Extract SNR."""
-    status_data = data.get("statusData", {})
-    snr = status_data.get("statusBarSNR", "0")
-    try:
-        return int(snr)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_bytes_received(data: dict) -> int:
-    """Extract bytes received."""
-    status_data = data.get("statusData", {})
-    bytes_rx = status_data.get("statusBarBytesReceived", "0")
-    try:
-        return int(bytes_rx)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_bytes_transmitted(data: dict) -> int:
-    """Extract bytes transmitted."""
-    status_data = data.get("statusData", {})
-    bytes_tx = status_data.get("statusBarBytesTransmitted", "0")
-    try:
-        return int(bytes_tx)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_bytes_total(data: dict) -> int:
-    """Extract total bytes."""
-    status_data = data.get("statusData", {})
-    bytes_total = status_data.get("statusBarBytesTotal", "0")
-    try:
-        return int(bytes_total)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_connection_duration(data: dict) -> int:
-    """Extract connection duration in seconds."""
-    status_data = data.get("statusData", {})
-    duration = status_data.get("statusBarConnectionDuration", "0")
-    try:
-        return int(duration)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_connected_clients(data: dict) -> int:
-    """Extract connected clients count."""
-    status_data = data.get("statusData", {})
-    count = status_data.get("statusBarClientListSize", "0")
-    try:
-        return int(count)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_wifi_clients(data: dict) -> int:
-    """Extract WiFi clients count."""
-    status_data = data.get("statusData", {})
-    count = status_data.get("statusBarWiFiClientListSize", "0")
-    try:
-        return int(count)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_primary_clients(data: dict) -> int:
-    """Extract primary clients count."""
-    status_data = data.get("statusData", {})
-    count = status_data.get("statusBarPrimaryClientListSize", "0")
-    try:
-        return int(count)
-    except (ValueError, TypeError):
-        return 0
-
-
-def get_network_attributes(data: dict) -> dict:
+    value_fn: Callable[[InseegoM3000Data], StateType] = None
+    attributes_fn: Callable[[InseegoM3000Data], dict] = None
+    # Snapshot fields read by value_fn/attributes_fn; the entity is only
+    # updated when one of them changes. Empty means update on every poll.
+    # The entity is only created once the device reports the first key.
+    keys: tuple[str, ...] = ()
+    # High-rate measurement: in long-term statistics mode its state is
+    # written at most every STATISTICS_STATE_INTERVAL.
+    throttled: bool = False
+    # With the noise filter enabled, changes of the first key within the
+    # band set by this option are not published (see filters.DeadbandFilter);
+    # a relative band is a fraction of the published value.
+    deadband_option: str | None = None
+    relative_deadband: bool = False
+
+
+@dataclass
+class InseegoRuntimeSensorEntityDescription(InseegoSensorEntityDescription):
+    """Describes a sensor computed from coordinator state, not the snapshot.
+
+    value_fn/attributes_fn receive the coordinator. These sensors are
+    written after every refresh, including polls that changed nothing and
+    failed ones, since their counters and timings change with each poll.
+    """
+
+    value_fn: Callable[[InseegoM3000DataUpdateCoordinator], StateType] = None
+    attributes_fn: Callable[[InseegoM3000DataUpdateCoordinator], dict] = None
+    # Keep reporting while the device is unreachable.
+    always_available: bool = False
+    # time.monotonic() at which the value changes without a new poll (e.g. a
+    # rolling window runs empty), or None; the state is written again then.
+    expires_fn: Callable[[InseegoM3000DataUpdateCoordinator], float | None] = None
+    # Measured by the latency prober: created once the prober runs, written
+    # after every probe round and only available while it is enabled.
+    latency: bool = False
+
+
+NETWORK_KEYS = (
+    "network",
+    "network_id",
+    "carrier",
+    "technology",
+    "band",
+    "bandwidth",
+    "pci",
+)
+IP_KEYS = ("ip_address", "ipv6_address", "gateway", "subnet_mask")
+
+
+def get_network_attributes(data: InseegoM3000Data) -> dict:
     """Get network-related attributes."""
-    status_data = data.get("statusData", {})
+    status = data.status
     return {
-        "network": status_data.get("statusBarNetwork", "Unknown"),
-        "network_id": status_data.get("statusBarNetworkID", "Unknown"),
-        "carrier": status_data.get("statusBarCarrier", "Unknown"),
-        "technology": status_data.get("statusBarTechnology", "Unknown"),
-        "band": status_data.get("statusBarBand", "Unknown").strip(),
-        "bandwidth": status_data.get("statusBarBandwidth", "Unknown").strip(),
-        "pci": status_data.get("statusBarPCI", "Unknown"),
+        "network": status.network,
+        "network_id": status.network_id,
+        "carrier": status.carrier,
+        "technology": status.technology,
+        "band": status.band,
+        "bandwidth": status.bandwidth,
+        "pci": status.pci,
     }
 
 
-def get_ip_attributes(data: dict) -> dict:
+def get_ip_attributes(data: InseegoM3000Data) -> dict:
     """Get IP-related attributes."""
-    status_data = data.get("statusData", {})
+    status = data.status
     return {
-        "ip_address": status_data.get("internetStatusIPAddress", "Unknown"),
-        "ipv6_address": status_data.get("internetStatusIPv6Address", "Unknown"),
-        "gateway": status_data.get("internetStatusGateway", "Unknown"),
-        "subnet_mask": status_data.get("internetStatusSubnetMask", "Unknown"),
+        "ip_address": status.ip_address,
+        "ipv6_address": status.ipv6_address,
+        "gateway": status.gateway,
+        "subnet_mask": status.subnet_mask,
     }
 
 
@@ -173,7 +132,10 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         icon="mdi:signal",
         native_unit_of_measurement="bars",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=get_signal_bars,
+        keys=("signal_bars", *NETWORK_KEYS),
+        throttled=True,
+        deadband_option=CONF_SIGNAL_DEADBAND,
+        value_fn=lambda data: data.status.signal_bars,
         attributes_fn=get_network_attributes,
     ),
     InseegoSensorEntityDescription(
@@ -182,33 +144,83 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=get_battery_percent,
+        keys=("battery_percent",),
+        value_fn=lambda data: data.status.battery_percent,
     ),
     InseegoSensorEntityDescription(
         key="network",
         name="Network",
         icon="mdi:network",
-        value_fn=lambda data: data.get("statusData", {}).get("statusBarNetwork", "Unknown"),
+        keys=NETWORK_KEYS,
+        value_fn=lambda data: data.status.network,
         attributes_fn=get_network_attributes,
     ),
     InseegoSensorEntityDescription(
         key="technology",
         name="Technology",
         icon="mdi:radio-tower",
-        value_fn=lambda data: data.get("statusData", {}).get("statusBarTechnology", "Unknown"),
+        keys=("technology",),
+        value_fn=lambda data: data.status.technology,
     ),
     InseegoSensorEntityDescription(
         key="connection_state",
         name="Connection State",
         icon="mdi:connection",
-        value_fn=lambda data: data.get("statusData", {}).get("statusBarConnectionState", "Unknown"),
+        keys=("connection_state",),
+        value_fn=lambda data: data.status.connection_state,
+    ),
+    InseegoSensorEntityDescription(
+        key="rx_rate",
+        name="Download Rate",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_unit_of_measurement=UnitOfDataRate.KILOBYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        keys=("rx_rate",),
+        throttled=True,
+        deadband_option=CONF_RATE_DEADBAND,
+        relative_deadband=True,
+        value_fn=lambda data: data.rates.rx_rate,
+    ),
+    InseegoSensorEntityDescription(
+        key="tx_rate",
+        name="Upload Rate",
+        icon="mdi:upload-network",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_unit_of_measurement=UnitOfDataRate.KILOBYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        keys=("tx_rate",),
+        throttled=True,
+        deadband_option=CONF_RATE_DEADBAND,
+        relative_deadband=True,
+        value_fn=lambda data: data.rates.tx_rate,
+    ),
+    InseegoSensorEntityDescription(
+        key="total_rate",
+        name="Total Throughput",
+        icon="mdi:swap-vertical",
+        device_class=SensorDeviceClass.DATA_RATE,
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_unit_of_measurement=UnitOfDataRate.KILOBYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        keys=("total_rate",),
+        throttled=True,
+        deadband_option=CONF_RATE_DEADBAND,
+        relative_deadband=True,
+        value_fn=lambda data: data.rates.total_rate,
     ),
     InseegoSensorEntityDescription(
         key="connected_clients",
         name="Connected Clients",
         icon="mdi:devices",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=get_connected_clients,
+        keys=("clients",),
+        value_fn=lambda data: data.status.clients,
     ),
     # Usage data sensors
     InseegoSensorEntityDescription(
@@ -219,7 +231,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL,
         suggested_display_precision=2,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: float(data.get("usageData", {}).get("lineUsage", "0")),
+        keys=("line_usage",),
+        value_fn=lambda data: data.usage.line_usage,
     ),
     InseegoSensorEntityDescription(
         key="billing_allowance",
@@ -228,7 +241,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.GIGABYTES,
         suggested_display_precision=2,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: float(data.get("usageData", {}).get("allowance", "0")),
+        keys=("allowance",),
+        value_fn=lambda data: data.usage.allowance,
     ),
     InseegoSensorEntityDescription(
         key="billing_remaining",
@@ -238,7 +252,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=2,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: float(data.get("usageData", {}).get("remainingUsage", "0")),
+        keys=("remaining_usage",),
+        value_fn=lambda data: data.usage.remaining_usage,
     ),
     InseegoSensorEntityDescription(
         key="billing_percentage_remaining",
@@ -247,7 +262,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: int(data.get("usageData", {}).get("barPercentageRemaining", "0")),
+        keys=("percentage_remaining",),
+        value_fn=lambda data: data.usage.percentage_remaining,
     ),
     InseegoSensorEntityDescription(
         key="billing_days_left",
@@ -256,7 +272,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.DAYS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: int(data.get("usageData", {}).get("daysLeft", "0")),
+        keys=("days_left",),
+        value_fn=lambda data: data.usage.days_left,
     ),
     InseegoSensorEntityDescription(
         key="billing_cycle_end",
@@ -264,7 +281,35 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         icon="mdi:calendar-end",
         device_class=SensorDeviceClass.DATE,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.get("usageData", {}).get("cycleEndDt", "Unknown").replace("&#x2F;", "/"),
+        keys=("cycle_end",),
+        value_fn=lambda data: data.usage.cycle_end,
+    ),
+    InseegoSensorEntityDescription(
+        key="billing_projected_usage",
+        name="Projected Cycle Usage",
+        icon="mdi:chart-timeline-variant-shimmer",
+        native_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_registry_enabled_default=False,
+        keys=("projected_usage", "usage_rate", "allowance"),
+        value_fn=lambda data: data.forecast.projected_usage,
+        attributes_fn=lambda data: {
+            "usage_rate_per_day": data.forecast.usage_rate,
+            "allowance": data.usage.allowance,
+        },
+    ),
+    InseegoSensorEntityDescription(
+        key="billing_time_to_exhaustion",
+        name="Time Until Allowance Used",
+        icon="mdi:timer-sand-complete",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_registry_enabled_default=False,
+        keys=("exhaustion_days",),
+        value_fn=lambda data: data.forecast.exhaustion_days,
     ),
 
     # ==========================================
@@ -277,7 +322,10 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=get_snr,
+        keys=("snr",),
+        throttled=True,
+        deadband_option=CONF_SNR_DEADBAND,
+        value_fn=lambda data: data.status.snr,
     ),
     InseegoSensorEntityDescription(
         key="bytes_received",
@@ -287,7 +335,9 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.BYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=get_bytes_received,
+        keys=("bytes_received",),
+        throttled=True,
+        value_fn=lambda data: data.status.bytes_received,
     ),
     InseegoSensorEntityDescription(
         key="bytes_transmitted",
@@ -297,7 +347,9 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.BYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=get_bytes_transmitted,
+        keys=("bytes_transmitted",),
+        throttled=True,
+        value_fn=lambda data: data.status.bytes_transmitted,
     ),
     InseegoSensorEntityDescription(
         key="bytes_total",
@@ -307,7 +359,45 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfInformation.BYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=get_bytes_total,
+        keys=("bytes_total",),
+        throttled=True,
+        value_fn=lambda data: data.status.bytes_total,
+    ),
+    InseegoSensorEntityDescription(
+        key="lifetime_received",
+        name="Lifetime Data Received",
+        icon="mdi:download",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        keys=("lifetime_received",),
+        throttled=True,
+        value_fn=lambda data: data.lifetime.lifetime_received,
+    ),
+    InseegoSensorEntityDescription(
+        key="lifetime_transmitted",
+        name="Lifetime Data Transmitted",
+        icon="mdi:upload",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        keys=("lifetime_transmitted",),
+        throttled=True,
+        value_fn=lambda data: data.lifetime.lifetime_transmitted,
+    ),
+    InseegoSensorEntityDescription(
+        key="lifetime_total",
+        name="Lifetime Data Usage",
+        icon="mdi:chart-line",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        keys=("lifetime_total",),
+        throttled=True,
+        value_fn=lambda data: data.lifetime.lifetime_total,
     ),
     InseegoSensorEntityDescription(
         key="billing_rx_usage",
@@ -318,7 +408,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         suggested_display_precision=2,
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: float(data.get("usageData", {}).get("rxUsage", "0")),
+        keys=("rx_usage",),
+        value_fn=lambda data: data.usage.rx_usage,
     ),
     InseegoSensorEntityDescription(
         key="billing_tx_usage",
@@ -329,7 +420,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         suggested_display_precision=2,
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: float(data.get("usageData", {}).get("txUsage", "0")),
+        keys=("tx_usage",),
+        value_fn=lambda data: data.usage.tx_usage,
     ),
    InseegoSensorEntityDescription(
         key="connection_duration",
@@ -339,14 +431,17 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.SECONDS,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=get_connection_duration,
+        keys=("connection_duration",),
+        throttled=True,
+        value_fn=lambda data: data.status.connection_duration,
     ),
     InseegoSensorEntityDescription(
         key="ip_address",
         name="IP Address",
         icon="mdi:ip-network",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("statusData", {}).get("internetStatusIPAddress", "Unknown"),
+        keys=IP_KEYS,
+        value_fn=lambda data: data.status.ip_address,
         attributes_fn=get_ip_attributes,
     ),
     InseegoSensorEntityDescription(
@@ -355,7 +450,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         icon="mdi:sim",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("statusData", {}).get("statusBarSimStatus", "Unknown"),
+        keys=("sim_status",),
+        value_fn=lambda data: data.status.sim_status,
     ),
     InseegoSensorEntityDescription(
         key="gps_status",
@@ -363,7 +459,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         icon="mdi:crosshairs-gps",
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("statusData", {}).get("statusBarGpsStatus", "Unknown"),
+        keys=("gps_status",),
+        value_fn=lambda data: data.status.gps_status,
     ),
     InseegoSensorEntityDescription(
         key="wifi_clients",
@@ -371,7 +468,8 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         icon="mdi:wifi",
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=get_wifi_clients,
+        keys=("wifi_clients",),
+        value_fn=lambda data: data.status.wifi_clients,
     ),
     InseegoSensorEntityDescription(
         key="primary_clients",
@@ -379,10 +477,246 @@ SENSOR_TYPES: tuple[InseegoSensorEntityDescription, ...] = (
         icon="mdi:account-network",
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=get_primary_clients,
+        keys=("primary_clients",),
+        value_fn=lambda data: data.status.primary_clients,
+    ),
+)
+
+def _statistics_fns(
+    metric: str, window: str
+) -> tuple[Callable, Callable, Callable]:
+    """Build value/attributes/expires functions for one rolling statistics window."""
+
+    def value_fn(coordinator: InseegoM3000DataUpdateCoordinator) -> StateType:
+        return coordinator.statistics[metric].summary(window, time.monotonic())["mean"]
+
+    def attributes_fn(coordinator: InseegoM3000DataUpdateCoordinator) -> dict:
+        summary = coordinator.statistics[metric].summary(window, time.monotonic())
+        return {
+            "min": summary["min"],
+            "max": summary["max"],
+            "p95": summary["p95"],
+            "samples": summary["samples"],
+        }
+
+    def expires_fn(coordinator: InseegoM3000DataUpdateCoordinator) -> float | None:
+        return coordinator.statistics[metric].windows[window].expires_at()
+
+    return value_fn, attributes_fn, expires_fn
+
+
+def _statistics_descriptions() -> tuple[InseegoRuntimeSensorEntityDescription, ...]:
+    """Describe a mean sensor (with min/max/p95 attributes) per metric and window."""
+    metrics = (
+        ("signal_bars", "Signal Strength", "bars", None, "mdi:signal"),
+        (
+            "snr",
+            "Signal to Noise Ratio",
+            SIGNAL_STRENGTH_DECIBELS,
+            None,
+            "mdi:signal-variant",
+        ),
+        (
+            "rx_rate",
+            "Download Rate",
+            UnitOfDataRate.BYTES_PER_SECOND,
+            SensorDeviceClass.DATA_RATE,
+            "mdi:download-network",
+        ),
+        (
+            "tx_rate",
+            "Upload Rate",
+            UnitOfDataRate.BYTES_PER_SECOND,
+            SensorDeviceClass.DATA_RATE,
+            "mdi:upload-network",
+        ),
+    )
+    descriptions = []
+    for metric, name, unit, device_class, icon in metrics:
+        for window in STATISTICS_WINDOWS:
+            value_fn, attributes_fn, expires_fn = _statistics_fns(metric, window)
+            descriptions.append(
+                InseegoRuntimeSensorEntityDescription(
+                    key=f"{metric}_mean_{window}",
+                    name=f"{name} Mean ({window})",
+                    icon=icon,
+                    device_class=device_class,
+                    native_unit_of_measurement=unit,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    suggested_display_precision=1,
+                    entity_registry_enabled_default=False,
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    value_fn=value_fn,
+                    attributes_fn=attributes_fn,
+                    expires_fn=expires_fn,
+                )
+            )
+    return tuple(descriptions)
+
+
+def _timing_fns(path: str | None) -> tuple[Callable, Callable]:
+    """Build value/attributes functions for an endpoint's request time.
+
+    ``path`` None describes the whole poll instead of a single endpoint.
+    """
+
+    def value_fn(coordinator: InseegoM3000DataUpdateCoordinator) -> StateType:
+        if path is None:
+            return coordinator.poll_timings.summary("poll")["p95"]
+        return coordinator.endpoint_stats[path].timings.summary("request")["p95"]
+
+    def attributes_fn(coordinator: InseegoM3000DataUpdateCoordinator) -> dict:
+        if path is None:
+            timings = coordinator.poll_timings
+            summary = timings.summary("poll")
+            phases = ("queue", "fan_out")
+            attributes = {}
+        else:
+            stats = coordinator.endpoint_stats[path]
+            timings = stats.timings
+            summary = timings.summary("request")
+            phases = ("connect", "ttfb", "download", "decode")
+            attributes = {"payload_size": stats.last_payload_size}
+        attributes.update(
+            {"last": summary["last"], "p50": summary["p50"], "p99": summary["p99"]}
+        )
+        for phase in phases:
+            attributes[f"{phase}_p95"] = timings.summary(phase)["p95"]
+        return attributes
+
+    return value_fn, attributes_fn
+
+
+def _timing_descriptions() -> tuple[InseegoRuntimeSensorEntityDescription, ...]:
+    """Describe the poll timing and poll outcome counter sensors."""
+    descriptions = []
+    for key, name, path in (
+        ("poll_duration", "Poll Duration", None),
+        ("status_request_time", "Status Request Time", STATUS_PATH),
+        ("usage_request_time", "Usage Request Time", USAGE_PATH),
+    ):
+        value_fn, attributes_fn = _timing_fns(path)
+        descriptions.append(
+            InseegoRuntimeSensorEntityDescription(
+                key=key,
+                name=f"{name} (p95)",
+                icon="mdi:timer-outline",
+                device_class=SensorDeviceClass.DURATION,
+                native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=1,
+                entity_registry_enabled_default=False,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                value_fn=value_fn,
+                attributes_fn=attributes_fn,
+            )
+        )
+    for key, name, counter, icon in (
+        ("successful_polls", "Successful Polls", "successes", "mdi:check-network"),
+        ("failed_polls", "Failed Polls", "failures", "mdi:close-network"),
+        ("timed_out_polls", "Timed Out Polls", "timeouts", "mdi:timer-alert"),
+    ):
+        descriptions.append(
+            InseegoRuntimeSensorEntityDescription(
+                key=key,
+                name=name,
+                icon=icon,
+                state_class=SensorStateClass.TOTAL_INCREASING,
+                entity_registry_enabled_default=False,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                # Failures are counted while the hotspot is unreachable.
+                always_available=True,
+                value_fn=lambda coordinator, counter=counter: getattr(
+                    coordinator.endpoint_stats[STATUS_PATH], counter
+                ),
+            )
+        )
+    return tuple(descriptions)
+
+
+def _latency_fn(field: str) -> Callable:
+    """Build a value function reading one field of the latency summary."""
+
+    def value_fn(coordinator: InseegoM3000DataUpdateCoordinator) -> StateType:
+        if coordinator.latency is None:
+            return None
+        return coordinator.latency.summary[field]
+
+    return value_fn
+
+
+def _latency_attributes(coordinator: InseegoM3000DataUpdateCoordinator) -> dict:
+    """Return the p95 latency, samples, targets and route of the prober."""
+    if (latency := coordinator.latency) is None:
+        return {}
+    return {
+        "p95_latency": latency.summary["p95"],
+        "samples": latency.summary["samples"],
+        "targets": [f"{host}:{port}" for host, port in latency.targets],
+        "interface": latency.route[1] if latency.route else None,
+        "shared_with": coordinator.shared_route,
+    }
+
+
+def _latency_descriptions() -> tuple[InseegoRuntimeSensorEntityDescription, ...]:
+    """Describe the WAN latency, jitter and packet loss sensors."""
+    descriptions = []
+    for key, name, field, icon in (
+        ("wan_latency", "WAN Latency", "latency", "mdi:timer-sand"),
+        ("wan_jitter", "WAN Jitter", "jitter", "mdi:sine-wave"),
+    ):
+        descriptions.append(
+            InseegoRuntimeSensorEntityDescription(
+                key=key,
+                name=name,
+                icon=icon,
+                device_class=SensorDeviceClass.DURATION,
+                native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=1,
+                latency=True,
+                value_fn=_latency_fn(field),
+            )
+        )
+    descriptions.append(
+        InseegoRuntimeSensorEntityDescription(
+            key="wan_packet_loss",
+            name="WAN Packet Loss",
+            icon="mdi:network-strength-off-outline",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+            latency=True,
+            value_fn=_latency_fn("loss"),
+            attributes_fn=_latency_attributes,
+        )
+    )
+    return tuple(descriptions)
+
+
+RUNTIME_SENSOR_TYPES: tuple[InseegoRuntimeSensorEntityDescription, ...] = (
+    *_latency_descriptions(),
+    InseegoRuntimeSensorEntityDescription(
+        key="connection_breaker",
+        name="Connection Breaker",
+        icon="mdi:lan-disconnect",
+        device_class=SensorDeviceClass.ENUM,
+        options=[BREAKER_CLOSED, BREAKER_OPEN, BREAKER_HALF_OPEN],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        always_available=True,
+        value_fn=lambda coordinator: coordinator.breaker.state,
+        attributes_fn=lambda coordinator: {
+            "consecutive_failures": coordinator.breaker.failures,
+            "backoff": round(coordinator.breaker.backoff)
+            if coordinator.breaker.backoff is not None
+            else None,
+        },
     ),
+    *_statistics_descriptions(),
+    *_timing_descriptions(),
 )
 
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -391,12 +725,42 @@ async def async_setup_entry(
     """Set up Inseego M3000 sensor based on a config entry."""
     coordinator: InseegoM3000DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
-        InseegoM3000Sensor(coordinator, description)
-        for description in SENSOR_TYPES
-    ]
-
-    async_add_entities(entities)
+    async_add_entities(
+        InseegoM3000RuntimeSensor(coordinator, description)
+        for description in RUNTIME_SENSOR_TYPES
+        if not description.latency
+    )
+
+    # The latency sensors are only created once the prober runs; it may be
+    # enabled later from the options.
+    latency_added = False
+
+    @callback
+    def _async_add_latency_sensors() -> None:
+        nonlocal latency_added
+        if latency_added or coordinator.latency is None:
+            return
+        latency_added = True
+        async_add_entities(
+            InseegoM3000RuntimeSensor(coordinator, description)
+            for description in RUNTIME_SENSOR_TYPES
+            if description.latency
+        )
+
+    _async_add_latency_sensors()
+    entry.async_on_unload(
+        coordinator.async_add_latency_listener(_async_add_latency_sensors)
+    )
+
+    # Only create sensors for fields the device reports; sensors for fields
+    # that show up later (e.g. after a firmware update) are added then.
+    entry.async_on_unload(
+        coordinator.async_add_reported_entities(
+            SENSOR_TYPES,
+            lambda description: InseegoM3000Sensor(coordinator, description),
+            async_add_entities,
+        )
+    )
 
 
 class InseegoM3000Sensor(CoordinatorEntity, SensorEntity):
@@ -404,6 +768,8 @@ class InseegoM3000Sensor(CoordinatorEntity, SensorEntity):
 
     entity_description: InseegoSensorEntityDescription
     _attr_has_entity_name = True
+    # Network/IP details rarely change; keep them out of every recorded state.
+    _unrecorded_attributes = frozenset({*NETWORK_KEYS, *IP_KEYS, "stale"})
 
     def __init__(
         self,
@@ -411,18 +777,95 @@ class InseegoM3000Sensor(CoordinatorEntity, SensorEntity):
         description: InseegoSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset(description.keys) or None)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.host}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.host)},
-            "name": f"Inseego M3000 ({coordinator.host})",
-            "manufacturer": "Inseego",
-            "model": "M3000",
-            "sw_version": coordinator.data.get("statusData", {}).get(
-                "StatusBarSoftwareUpdateSourceVersion", "Unknown"
-            ),
-        }
+        self._attr_device_info = coordinator.device_info
+        self._written_at: float | None = None
+        self._written_available: bool | None = None
+        # Pending re-evaluation of a suppressed update
+        self._retry_unsub: CALLBACK_TYPE | None = None
+        self._filter = (
+            DeadbandFilter(description.deadband_option, description.relative_deadband)
+            if description.deadband_option
+            else None
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Cancel a pending re-evaluation when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_retry)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unless it is rate limited or filtered out."""
+        if not self._suppress_update():
+            super()._handle_coordinator_update()
+
+    @callback
+    def _async_schedule_retry(self, delay: float) -> None:
+        """Evaluate a suppressed update again after ``delay`` seconds.
+
+        Entities are only updated when their fields change, so without this
+        a suppressed value that then stays the same would never be written.
+        """
+        self._async_cancel_retry()
+        self._retry_unsub = async_call_later(self.hass, delay, self._async_retry)
+
+    @callback
+    def _async_cancel_retry(self) -> None:
+        """Cancel the pending re-evaluation, if any."""
+        if self._retry_unsub is not None:
+            self._retry_unsub()
+            self._retry_unsub = None
+
+    @callback
+    def _async_retry(self, _now: datetime) -> None:
+        """Evaluate the suppressed update again."""
+        self._retry_unsub = None
+        self._handle_coordinator_update()
+
+    def _suppress_update(self) -> bool:
+        """Return True if this update should not be written."""
+        description = self.entity_description
+        coordinator = self.coordinator
+        now = time.monotonic()
+        # Availability changes are always written.
+        if self.available == self._written_available:
+            if (
+                description.throttled
+                and coordinator.long_term_statistics is not None
+                and self._written_at is not None
+                and now - self._written_at < STATISTICS_STATE_INTERVAL
+            ):
+                # Write the latest value at the end of the interval.
+                self._async_schedule_retry(
+                    STATISTICS_STATE_INTERVAL - (now - self._written_at)
+                )
+                return True
+            # Only filter when none of the fields read for the attributes
+            # changed, so attribute changes still get through.
+            changed = coordinator.changed_keys
+            options = coordinator.noise_filter
+            value = self.native_value
+            if (
+                self._filter is not None
+                and options is not None
+                and changed is not None
+                and changed.isdisjoint(description.keys[1:])
+                and not self._filter.accept(value, now, options)
+            ):
+                # Publish it once the hold time or the maximum age is over.
+                if (delay := self._filter.retry_in(value, now, options)) is not None:
+                    self._async_schedule_retry(delay)
+                return True
+
+        self._async_cancel_retry()
+        self._written_at = now
+        self._written_available = self.available
+        if self._filter is not None:
+            self._filter.published(self.native_value, now)
+        return False
 
     @property
     def native_value(self) -> StateType:
@@ -434,6 +877,75 @@ class InseegoM3000Sensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional attributes."""
+        attributes = {}
         if self.entity_description.attributes_fn:
-            return self.entity_description.attributes_fn(self.coordinator.data)
+            attributes = self.coordinator.derived(
+                self.entity_description.attributes_fn
+            )
+        if self.coordinator.stale:
+            # Restored from storage; no live poll has succeeded yet.
+            attributes = {**attributes, "stale": True}
+        return attributes
+
+
+class InseegoM3000RuntimeSensor(InseegoM3000Sensor):
+    """Sensor whose value is computed from coordinator state."""
+
+    entity_description: InseegoRuntimeSensorEntityDescription
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for latency measurements or the end of every refresh."""
+        await super().async_added_to_hass()
+        if self.entity_description.latency:
+            self.async_on_remove(
+                self.coordinator.async_add_latency_listener(self.async_write_ha_state)
+            )
+        else:
+            self.async_on_remove(
+                self.coordinator.async_add_refresh_listener(self._handle_refresh)
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Leave sensors written after every refresh to _handle_refresh."""
+        if self.entity_description.latency:
+            super()._handle_coordinator_update()
+
+    @callback
+    def _handle_refresh(self) -> None:
+        """Write the state once a refresh has finished."""
+        super()._handle_coordinator_update()
+        # Polls may be further apart than a rolling window is long.
+        if (expires_fn := self.entity_description.expires_fn) is not None and (
+            expires_at := expires_fn(self.coordinator)
+        ) is not None:
+            self._async_schedule_retry(max(expires_at - time.monotonic(), 0))
+
+    @callback
+    def _async_retry(self, _now: datetime) -> None:
+        """Write the state again once the value changed on its own."""
+        self._retry_unsub = None
+        self._handle_refresh()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        if self.entity_description.latency:
+            return self.coordinator.latency is not None
+        return self.entity_description.always_available or super().available
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if not self.available:
+            return None
+        if self.entity_description.value_fn:
+            return self.entity_description.value_fn(self.coordinator)
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional attributes."""
+        if self.available and self.entity_description.attributes_fn:
+            return self.entity_description.attributes_fn(self.coordinator)
         return {}
@@ -0,0 +1,139 @@
+"""Tests for the state write filters in filters.py."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.inseego_m3000.filters import (
+    DeadbandFilter,
+    Debouncer,
+    NoiseFilterOptions,
+)
+
+SIGNAL = "signal_deadband"
+RATE = "rate_deadband"
+
+
+def options(min_hold: float = 0, max_age: float = 900) -> NoiseFilterOptions:
+    """Return filter options with a 1 bar signal and a 10% rate band."""
+    return NoiseFilterOptions(
+        min_hold=min_hold,
+        debounce_polls=2,
+        max_age=max_age,
+        deadbands={SIGNAL: 1, RATE: 0.1},
+    )
+
+
+def published(value: float, now: float = 0, **kwargs) -> DeadbandFilter:
+    """Return a filter that published ``value`` at ``now``."""
+    deadband = DeadbandFilter(**kwargs)
+    deadband.published(value, now)
+    return deadband
+
+
+def test_first_value_is_accepted() -> None:
+    """Nothing was published yet, so any value is."""
+    deadband = DeadbandFilter(SIGNAL)
+    assert deadband.accept(3, 0, options())
+    assert deadband.retry_in(3, 0, options()) is None
+
+
+def test_published_value_is_not_repeated() -> None:
+    """The published value is never published again."""
+    deadband = published(3, option=SIGNAL)
+    assert not deadband.accept(3, 5000, options())
+    assert deadband.retry_in(3, 5000, options()) is None
+
+
+@pytest.mark.parametrize(("value", "accepted"), [(4, False), (2, False), (5, True)])
+def test_absolute_band(value: int, accepted: bool) -> None:
+    """Changes up to the band are held back, larger ones published."""
+    assert published(3, option=SIGNAL).accept(value, 10, options()) is accepted
+
+
+@pytest.mark.parametrize(
+    ("value", "accepted"), [(1090.0, False), (910.0, False), (1101.0, True)]
+)
+def test_relative_band(value: float, accepted: bool) -> None:
+    """A relative band is a fraction of the published value."""
+    deadband = published(1000.0, option=RATE, relative=True)
+    assert deadband.accept(value, 10, options()) is accepted
+
+
+def test_option_without_band_publishes_any_change() -> None:
+    """An option missing from the deadbands has no band."""
+    assert published(3, option="unknown").accept(3.5, 10, options())
+
+
+def test_non_numeric_change_is_accepted() -> None:
+    """Values without a distance are published whenever they change."""
+    deadband = published("LTE", option=SIGNAL)
+    assert deadband.accept("5G", 10, options())
+
+
+def test_hold() -> None:
+    """Within the minimum hold time even large changes are held back."""
+    deadband = published(3, option=SIGNAL)
+    assert not deadband.accept(0, 20, options(min_hold=60))
+    assert deadband.retry_in(0, 20, options(min_hold=60)) == 40
+    assert deadband.accept(0, 60, options(min_hold=60))
+
+
+def test_max_age() -> None:
+    """A change within the band is published once the last one is max_age old."""
+    deadband = published(3, option=SIGNAL)
+    assert not deadband.accept(4, 100, options(max_age=900))
+    assert deadband.retry_in(4, 100, options(max_age=900)) == 800
+    assert deadband.accept(4, 900, options(max_age=900))
+    assert deadband.retry_in(4, 1000, options(max_age=900)) == 0
+
+
+def test_published_restarts_hold_and_age() -> None:
+    """Publishing a value makes it the reference for the next ones."""
+    deadband = published(3, option=SIGNAL)
+    deadband.published(5, 100)
+    assert not deadband.accept(4, 150, options())
+    assert deadband.retry_in(4, 150, options()) == 850
+
+
+def test_debouncer_takes_the_first_value() -> None:
+    """The first poll sets the state without debouncing."""
+    debouncer = Debouncer()
+    assert debouncer.update(True, 3) is True
+    assert debouncer.state is True
+
+
+def test_debouncer_needs_consecutive_polls() -> None:
+    """A transition is only accepted once it lasted ``polls`` polls."""
+    debouncer = Debouncer()
+    debouncer.update(True, 3)
+    assert debouncer.update(False, 3) is True
+    assert debouncer.update(False, 3) is True
+    assert debouncer.update(False, 3) is False
+    assert debouncer.state is False
+
+
+def test_debouncer_drops_interrupted_transitions() -> None:
+    """Going back to the state before the count is reached starts over."""
+    debouncer = Debouncer()
+    debouncer.update(True, 2)
+    assert debouncer.update(False, 2) is True
+    assert debouncer.update(True, 2) is True
+    assert debouncer.update(False, 2) is True
+    assert debouncer.update(False, 2) is False
+
+
+def test_debouncer_single_poll() -> None:
+    """With one poll every transition is accepted immediately."""
+    debouncer = Debouncer()
+    debouncer.update(True, 1)
+    assert debouncer.update(False, 1) is False
+
+
+def test_debouncer_reset() -> None:
+    """After a reset the next value is taken as is."""
+    debouncer = Debouncer()
+    debouncer.update(True, 2)
+    debouncer.update(False, 2)
+    debouncer.reset()
+    assert debouncer.state is None
+    assert debouncer.update(False, 2) is False
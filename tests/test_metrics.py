@@ -0,0 +1,148 @@
+"""Tests for the rolling windows and the usage forecaster in metrics.py."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.inseego_m3000.metrics import (
+    Histogram,
+    RollingWindow,
+    UsageForecaster,
+)
+from custom_components.inseego_m3000.models import UsageSnapshot
+
+HOUR = 3600
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def window(seconds: float = 300, capacity: int = 100) -> RollingWindow:
+    """Return a window with one bucket per integer from 0 to 10."""
+    return RollingWindow(seconds, capacity, Histogram.linear(0, 10, 1))
+
+
+def test_empty_window() -> None:
+    """An empty window has no statistics."""
+    rolling = window()
+    assert rolling.summary(0) == {
+        "min": None,
+        "max": None,
+        "mean": None,
+        "p95": None,
+        "samples": 0,
+    }
+    assert rolling.expires_at() is None
+
+
+def test_window_statistics() -> None:
+    """Min, max, mean and the bucketed p95 of the samples."""
+    rolling = window()
+    for second, value in enumerate([3, 1, 4, 1, 5, 9, 2, 6]):
+        rolling.add(second, value)
+    summary = rolling.summary(8)
+    assert summary["min"] == 1
+    assert summary["max"] == 9
+    assert summary["mean"] == pytest.approx(31 / 8)
+    assert summary["p95"] == 9
+    assert summary["samples"] == 8
+
+
+def test_p95_is_capped_at_the_maximum() -> None:
+    """The bucket edge is never reported above the largest sample."""
+    rolling = RollingWindow(300, 10, Histogram.linear(0, 10, 5))
+    rolling.add(0, 2)
+    assert rolling.summary(0)["p95"] == 2
+
+
+def test_old_samples_expire() -> None:
+    """Samples older than the window no longer count."""
+    rolling = window(seconds=10)
+    rolling.add(0, 9)
+    rolling.add(5, 1)
+    rolling.add(8, 3)
+    summary = rolling.summary(12)
+    assert (summary["min"], summary["max"], summary["samples"]) == (1, 3, 2)
+    assert summary["mean"] == 2
+    assert rolling.expires_at() == 18
+    assert rolling.summary(18)["samples"] == 0
+
+
+def test_capacity_evicts_the_oldest_sample() -> None:
+    """A full ring buffer drops its oldest sample, and its min/max."""
+    rolling = window(capacity=3)
+    for second, value in enumerate([0, 7, 5, 6]):
+        rolling.add(second, value)
+    summary = rolling.summary(3)
+    assert (summary["min"], summary["max"], summary["samples"]) == (5, 7, 3)
+    assert summary["mean"] == 6
+
+
+def usage(line_usage: float, cycle_end: str = "01/31/2026") -> UsageSnapshot:
+    """Return a usage snapshot of a 100 GB plan."""
+    return UsageSnapshot(
+        line_usage=line_usage,
+        allowance=100.0,
+        remaining_usage=100.0 - line_usage,
+        percentage_remaining=int(100 - line_usage),
+        days_left=30,
+        cycle_end=cycle_end,
+        rx_usage=line_usage,
+        tx_usage=0.0,
+    )
+
+
+def feed(forecaster: UsageForecaster, hours: int, gb_per_hour: float) -> None:
+    """Add hourly samples growing at a constant rate."""
+    for hour in range(hours + 1):
+        forecaster.add(START + timedelta(hours=hour), usage(hour * gb_per_hour))
+
+
+def test_no_rate_before_the_minimum_span() -> None:
+    """Samples spanning less than min_span give no forecast."""
+    forecaster = UsageForecaster(6 * HOUR)
+    feed(forecaster, 5, 0.5)
+    assert forecaster.rate() is None
+
+
+def test_constant_rate() -> None:
+    """A linear usage gives its rate and the projection to the cycle end."""
+    forecaster = UsageForecaster(6 * HOUR)
+    feed(forecaster, 6, 0.5)
+    assert forecaster.rate() == pytest.approx(12)
+    now = START + timedelta(hours=6)
+    forecast = forecaster.project(now, usage(3))
+    # 31 days from the start of January 1 to the end of January 31
+    assert forecast.projected_usage == pytest.approx(3 + 12 * (31 - 0.25))
+    assert forecast.exhaustion_days == pytest.approx(97 / 12)
+
+
+def test_new_cycle_starts_over() -> None:
+    """A different cycle end date resets the fit."""
+    forecaster = UsageForecaster(6 * HOUR)
+    feed(forecaster, 6, 0.5)
+    forecaster.add(START + timedelta(hours=7), usage(0.1, cycle_end="02/28/2026"))
+    assert forecaster.rate() is None
+
+
+def test_usage_drop_starts_over() -> None:
+    """Usage going down (e.g. a plan change) resets the fit."""
+    forecaster = UsageForecaster(6 * HOUR)
+    feed(forecaster, 6, 0.5)
+    forecaster.add(START + timedelta(hours=7), usage(1))
+    assert forecaster.rate() is None
+
+
+def test_forecaster_restore() -> None:
+    """The persisted state gives the same rate after a restart."""
+    forecaster = UsageForecaster(6 * HOUR)
+    feed(forecaster, 6, 0.5)
+    restored = UsageForecaster(6 * HOUR)
+    restored.restore(forecaster.as_dict())
+    assert restored.rate() == pytest.approx(forecaster.rate())
+
+
+def test_forecaster_ignores_invalid_state() -> None:
+    """Invalid stored state leaves the forecaster empty."""
+    forecaster = UsageForecaster(6 * HOUR)
+    forecaster.restore({"cycle_end": "01/31/2026", "sums": "garbage"})
+    assert forecaster.as_dict()["sums"] == [0, 0.0, 0.0, 0.0, 0.0]
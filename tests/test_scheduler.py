@@ -0,0 +1,82 @@
+"""Tests for the circuit breaker in scheduler.py."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.inseego_m3000.scheduler import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    MAX_DOUBLINGS,
+    CircuitBreaker,
+)
+
+
+def test_closed_below_threshold() -> None:
+    """Failures below the threshold don't back off."""
+    breaker = CircuitBreaker(30, 600, 3)
+    assert breaker.record_failure() is None
+    assert breaker.record_failure() is None
+    assert breaker.closed
+    assert breaker.failures == 2
+    assert breaker.backoff is None
+
+
+def test_opens_at_threshold() -> None:
+    """The threshold-th failure opens the breaker with a jittered base delay."""
+    breaker = CircuitBreaker(30, 600, 3)
+    for _ in range(2):
+        breaker.record_failure()
+    backoff = breaker.record_failure()
+    assert breaker.state == BREAKER_OPEN
+    assert 15 <= backoff <= 30
+    assert breaker.backoff == backoff
+
+
+def test_backoff_doubles_up_to_the_maximum() -> None:
+    """Every further failure doubles the delay until max_delay."""
+    breaker = CircuitBreaker(30, 600, 1)
+    backoffs = [breaker.record_failure() for _ in range(MAX_DOUBLINGS + 3)]
+    for failures, backoff in enumerate(backoffs):
+        delay = min(30 * 2**min(failures, MAX_DOUBLINGS), 600)
+        assert delay / 2 <= backoff <= delay
+    assert breaker.failures == 1 + MAX_DOUBLINGS
+
+
+def test_half_open_probe() -> None:
+    """The poll after the backoff is a probe; a success closes the breaker."""
+    breaker = CircuitBreaker(30, 600, 1)
+    breaker.record_failure()
+    breaker.before_poll()
+    assert breaker.state == BREAKER_HALF_OPEN
+    assert not breaker.closed
+    assert breaker.record_success() is True
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.failures == 0
+    assert breaker.backoff is None
+
+
+def test_failed_probe_opens_again() -> None:
+    """A failed probe opens the breaker with a longer backoff."""
+    breaker = CircuitBreaker(30, 600, 1)
+    breaker.record_failure()
+    breaker.before_poll()
+    assert 30 <= breaker.record_failure() <= 60
+    assert breaker.state == BREAKER_OPEN
+
+
+@pytest.mark.parametrize("state", [BREAKER_CLOSED, BREAKER_HALF_OPEN])
+def test_before_poll_only_changes_an_open_breaker(state: str) -> None:
+    """Only an open breaker turns half-open."""
+    breaker = CircuitBreaker(30, 600, 1)
+    breaker.state = state
+    breaker.before_poll()
+    assert breaker.state == state
+
+
+def test_success_while_closed() -> None:
+    """A success on a closed breaker resets the count but reports no change."""
+    breaker = CircuitBreaker(30, 600, 3)
+    breaker.record_failure()
+    assert breaker.record_success() is False
+    assert breaker.failures == 0